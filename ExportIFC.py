@@ -18,6 +18,11 @@
         5. nomap_json            -> JSON настроек IFC-экспорта без маппинга
                                     (опционально).
     - Порядок строк в <TMP_NAME>.csv определяет порядок экспорта.
+    - Оркестратор пишет отдельный <TMP_NAME><ver>.csv на каждую версию и
+      передаёт версию через переменную окружения ENV_REVIT_VERSION; без
+      неё читается общий <TMP_NAME>.csv.
+    - Момент запуска оркестратора приходит в ENV_RUN_DATE: txt-логи
+      датируются этим днём (без переменной — текущей датой процесса).
     - Глобальная __models__ из pyRevit не используется как основной
       источник путей; при необходимости может быть задействована
       отдельным отладочным кодом.
@@ -40,7 +45,9 @@
     - FLAG_UNMAPPED управляет сценарием «без маппинга».
 """
 import gc
+import os
 from pathlib import Path
+from datetime import datetime
 from typing import Union, Optional
 
 # доступ к Revit-хосту внутри pyRevit
@@ -48,6 +55,7 @@ from pyrevit import HOST_APP  # type: ignore
 
 from config.settings import SETTINGS as STG
 from config.paths import DIR_ADMIN_DATA, DIR_LOGS
+from config.constants import ENV_REVIT_VERSION, ENV_RUN_DATE
 
 from revit._api import DB
 from revit.jobs import ExportJob
@@ -55,6 +63,7 @@ from revit.task_reader import iter_jobs
 from revit.views import find_export_view3d
 from revit.ifc_options import load_mapping_json, build_ifc_export_options
 
+from utils.logs import set_run_date
 from utils.log_buckets import PyRevitExportLogBucket as LogBucket
 
 FLAG_UNMAPPED = STG.enable_unmapped_export
@@ -84,16 +93,24 @@ class ExportIFCRunner(object):
           Revit API (PurgeReleasedAPIObjects).
     """
 
-    __slots__ = ("_admin_dir", "_log_dir", "_logs")
+    __slots__ = ("_admin_dir", "_log_dir", "_version", "_logs")
 
-    def __init__(self, admin_dir: Path, log_dir: Path) -> None:
+    def __init__(
+        self,
+        admin_dir: Path,
+        log_dir: Path,
+        version: Optional[int] = None,
+    ) -> None:
         """Создаёт исполнитель экспорта IFC.
 
         :param admin_dir: Путь к каталогу admin_data.
         :param log_dir:   Путь к каталогу логов.
+        :param version:   Версия Revit, чей <TMP_NAME><ver>.csv читается
+                          (None — общий <TMP_NAME>.csv).
         """
         self._admin_dir = admin_dir
         self._log_dir = log_dir
+        self._version = version
         self._logs = LogBucket()
 
     # --------------------- фабрика опций открытия -------------------------
@@ -194,8 +211,8 @@ class ExportIFCRunner(object):
         t = DB.Transaction(doc, "ExportIFC")
         t.Start()  # type: ignore
         try:
-            # получаем имя IFC-файла из пути к RVT
-            ifc_name = job.rvt_path.stem
+            # получаем имя IFC-файла из пути к RVT (аналог Path.stem)
+            ifc_name = os.path.splitext(os.path.basename(job.rvt_path))[0]
 
             # --- Экспорт с маппингом ---
             if job.output_dir_mapping and job.mapping_json:
@@ -229,9 +246,9 @@ class ExportIFCRunner(object):
         doc: DB.Document,
         view3d: DB.View,
         ifc_name: str,
-        output_dir: Path,
-        config_json: Path,
-        family_mapping_file: Path,
+        output_dir: str,
+        config_json: str,
+        family_mapping_file: str,
     ) -> None:
         """Выполняет один экспорт IFC по указанному набору настроек.
 
@@ -251,18 +268,18 @@ class ExportIFCRunner(object):
         :param family_mapping_file: Файл маппинга семейств/категорий.
         """
         # получаем опции экспорта в .NET-словарь
-        cfg = load_mapping_json(str(config_json))
+        cfg = load_mapping_json(config_json)
 
         # строим опции экспорта IFC
         ifc_opts = build_ifc_export_options(
-            str(family_mapping_file),
+            family_mapping_file,
             cfg,
             view3d.Id,
         )
 
         # экспортируем IFC с опциями в заданную директорию
         doc.Export(
-            str(output_dir),
+            output_dir,
             ifc_name,
             ifc_opts,
         )
@@ -272,14 +289,12 @@ class ExportIFCRunner(object):
         """
         Основной цикл обработки всех заданий из admin_data/<TMP_NAME>.csv.
         """
-        jobs = iter_jobs(self._admin_dir)
-        if not jobs:
-            return
-
-        for job in jobs:
+        # Задания читаются из CSV по одной строке (генератор); при
+        # отсутствии CSV цикл просто не выполнится.
+        for job in iter_jobs(self._admin_dir, self._version):
             # 0) Быстрая проверка: файл модели должен существовать на диске.
-            rvt_path = job.rvt_path  # ExportJob уже приводит к Path
-            if not rvt_path.exists():
+            rvt_path = job.rvt_path  # ExportJob хранит пути строками
+            if not os.path.exists(rvt_path):
                 self._logs.opening_errors.append(
                     f"{rvt_path} - файл модели не найден на диске"
                 )
@@ -324,13 +339,40 @@ class ExportIFCRunner(object):
 
 
 # ------------------------ точка входа для pyRevit -------------------------
+def _env_version() -> Optional[int]:
+    """Версия Revit, переданная оркестратором через ENV_REVIT_VERSION.
+
+    :return: Год версии Revit или None, если переменная не задана
+             (например, ручной запуск без оркестратора).
+    """
+    val = os.environ.get(ENV_REVIT_VERSION, "").strip()
+    return int(val) if val.isdigit() else None
+
+
+def _env_run_date() -> Optional[datetime]:
+    """Момент запуска оркестратора, переданный через ENV_RUN_DATE.
+
+    :return: datetime (локальное время) или None, если переменная не задана
+             или не разбирается как timestamp.
+    """
+    val = os.environ.get(ENV_RUN_DATE, "").strip()
+    if not val:
+        return None
+    try:
+        return datetime.fromtimestamp(float(val))
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
 def main() -> None:
     """Точка входа для pyRevit.
 
     pyRevit исполняет модуль целиком, поэтому main() вызывается напрямую,
     без проверки __name__.
     """
-    runner = ExportIFCRunner(DIR_ADMIN_DATA, DIR_LOGS)
+    # Логи датируются днём запуска оркестратора (без него — текущим).
+    set_run_date(_env_run_date())
+    runner = ExportIFCRunner(DIR_ADMIN_DATA, DIR_LOGS, _env_version())
     runner.run()
 
 
@@ -22,6 +22,7 @@ from .files import (
     MANAGE_PATH,
     HISTORY_PATH,
     SCRIPT_EXPORT_IFC,
+    VERSION_CACHE_PATH,
     JSON_CONFIG_FILENAME,
     build_task_path,
     build_csv_path,
@@ -39,6 +40,9 @@ REVIT_VERSIONS = SETTINGS.revit_versions
 FLAG_UNMAPPED = SETTINGS.enable_unmapped_export
 """Флаг выгрузки дополнительного IFC без маппирования."""
 
+MAX_PARALLEL_VERSIONS = SETTINGS.max_parallel_versions
+"""Число версий Revit, обрабатываемых pyRevit одновременно (>= 1)."""
+
 # ----------------------- листы Excel (задаются в ini) ------------------------
 SHEET_PATH = SETTINGS.sheet_path
 """Лист Excel с путями/настройками."""
@@ -63,6 +67,7 @@ __all__ = [
     # ревит и флаги
     "REVIT_VERSIONS",
     "FLAG_UNMAPPED",
+    "MAX_PARALLEL_VERSIONS",
     # формат даты/времени
     "FORMAT_DATETIME",
     # имя логгера
@@ -81,6 +86,7 @@ __all__ = [
     "SHEET_HISTORY",
     "MANAGE_PATH",
     "HISTORY_PATH",
+    "VERSION_CACHE_PATH",
     "DIR_EXPORT_CONFIG",
     "DIR_ADMIN_DATA",
     "DIR_LOGS",
@@ -19,9 +19,24 @@ MANAGE_NAME = "manage"
 HISTORY_NAME = "history"
 """Базовое имя файла истории запусков (имя файла: HISTORY_NAME + ".xlsx")."""
 
+VERSION_CACHE_NAME = ".version_cache"
+"""Базовое имя кэша версий RVT (имя файла: VERSION_CACHE_NAME + ".json")."""
+
 LOGGER_NAME = "export_ifc"
 """Имя корневого логгера приложения."""
 
+ENV_REVIT_VERSION = "EXPORTIFC_REVIT_VERSION"
+"""Переменная окружения с версией Revit для процесса pyRevit.
+
+По ней ExportIFC.py выбирает свой <TMP_NAME><ver>.csv.
+"""
+
+ENV_RUN_DATE = "EXPORTIFC_RUN_DATE"
+"""Переменная окружения с моментом запуска оркестратора (timestamp).
+
+По ней ExportIFC.py датирует txt-логи тем же днём, что и оркестратор.
+"""
+
 ADMIN_DATA_NAME = 'admin_data'
 """Имя каталога с административными файлами (внешним оркестратором)."""
 
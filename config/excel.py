@@ -9,6 +9,8 @@
 Контракты:
     - Индексы колонок 0-based (A=0, B=1, ...), удобно для
       iter_rows(values_only=True).
+    - *_NCOLS — число колонок, которые читаются с листа (max_col для
+      iter_rows): остальные столбцы не разбираются вовсе.
     - Группировка по назначению:
         * MANAGE_* — <MANAGE_NAME>.xlsx;
         * HISTORY_* — <HISTORY_NAME>.xlsx.
@@ -46,10 +48,16 @@ MANAGE_COL_OUT_NOMAP = 4
 MANAGE_COL_NOMAP_NAME = 5
 """F: Имя .json для выгрузки без маппинга (опц.)."""
 
+MANAGE_NCOLS = MANAGE_COL_NOMAP_NAME + 1
+"""Число читаемых колонок листа SHEET_PATH (A:F, max_col для iter_rows)."""
+
 # Колонки листа SHEET_IGNORE (manage)
 MANAGE_IGNORE_COL_PATH = 0
 """A: Путь для игнора."""
 
+MANAGE_IGNORE_NCOLS = MANAGE_IGNORE_COL_PATH + 1
+"""Число читаемых колонок листа SHEET_IGNORE (A, max_col для iter_rows)."""
+
 # --------------------------- <HISTORY_NAME>.xlsx ---------------------------
 # Лист:
 #   SHEET_HISTORY — задаётся в settings.ini.
@@ -70,3 +78,6 @@ HISTORY_COL_RVT_PATH = 0
 
 HISTORY_COL_DATETIME = 1
 """B: Дата модификации RVT (округлённая до минут)."""
+
+HISTORY_NCOLS = HISTORY_COL_DATETIME + 1
+"""Число читаемых колонок листа SHEET_HISTORY (A:B, max_col для iter_rows)."""
@@ -3,7 +3,7 @@
 
 Назначение:
     - Хранит имена ключевых файлов (<MANAGE_NAME>.xlsx,
-      <HISTORY_NAME>.xlsx, скрипты).
+      <HISTORY_NAME>.xlsx, кэш версий RVT, скрипты).
     - Формирует абсолютные пути на основе настроек Settings и структуры
       проекта.
 
@@ -13,16 +13,19 @@
     - Каталоги и файлы в этом модуле не создаются — функции только формируют
       пути.
     - build_task_path формирует путь Task{version}.txt в DIR_ADMIN_DATA.
-    - build_csv_path формирует путь <name>.csv в указанной базе
-      (по умолчанию DIR_ADMIN_DATA).
+    - build_csv_path формирует путь <name>.csv (или <name><ver>.csv для
+      конкретной версии Revit) в указанной базе (по умолчанию
+      DIR_ADMIN_DATA).
 """
 from pathlib import Path
+from typing import Optional
 
 from config.settings import SETTINGS as STG
 from config.constants import (
     TMP_NAME,
     MANAGE_NAME,
     HISTORY_NAME,
+    VERSION_CACHE_NAME,
 )
 from config.paths import (
     DIR_SCRIPTS,
@@ -47,6 +50,9 @@ MANAGE_PATH: Path = DIR_ADMIN_DATA / f"{MANAGE_NAME}.xlsx"
 HISTORY_PATH: Path = DIR_HISTORY / f"{HISTORY_NAME}.xlsx"
 """Путь к файлу истории запусков <HISTORY_NAME>.xlsx."""
 
+VERSION_CACHE_PATH: Path = DIR_ADMIN_DATA / f"{VERSION_CACHE_NAME}.json"
+"""Путь к кэшу версий RVT <VERSION_CACHE_NAME>.json."""
+
 
 # ----- служебные пути в admin_data (Task*.txt, <TMP_NAME>.csv и др.) -----
 def build_task_path(version: int) -> Path:
@@ -61,13 +67,19 @@ def build_task_path(version: int) -> Path:
 
 
 def build_csv_path(base_dir: Path = DIR_ADMIN_DATA,
-                   name: str = TMP_NAME) -> Path:
+                   name: str = TMP_NAME,
+                   version: Optional[int] = None) -> Path:
     """Возвращает путь к CSV-файлу в указанной директории.
 
-    По умолчанию формирует ``<TMP_NAME>.csv`` в DIR_ADMIN_DATA.
+    По умолчанию формирует ``<TMP_NAME>.csv`` в DIR_ADMIN_DATA; при
+    указанной версии — ``<TMP_NAME><version>.csv`` (свой CSV на каждую
+    версию Revit, чтобы версии могли обрабатываться одновременно).
 
     :param base_dir: Базовая директория, в которой будет лежать CSV-файл.
     :param name:     Имя файла без расширения (например, ``"tmp"``).
-    :return:         Абсолютный путь к CSV-файлу (base_dir / f"{name}.csv").
+    :param version:  Версия Revit (опц.), добавляется к имени файла.
+    :return:         Абсолютный путь к CSV-файлу.
     """
-    return base_dir / f"{name}.csv"
+    if version is None:
+        return base_dir / f"{name}.csv"
+    return base_dir / f"{name}{version}.csv"
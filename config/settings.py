@@ -228,6 +228,16 @@ class Settings:
         """
         return self._get_def("Revit", "export_view3d_name", "Navisworks")
 
+    @property
+    def max_parallel_versions(self) -> int:
+        """Возвращает число версий Revit, обрабатываемых pyRevit одновременно.
+
+        :return: Количество одновременных запусков pyRevit (не меньше 1;
+                 по умолчанию 1 — версии по очереди).
+        """
+        val = self._get_def("Revit", "max_parallel_versions", "1")
+        return max(1, int(str(val).strip()))
+
     # ------------------------- Excel -------------------------
     @property
     def sheet_path(self) -> str:
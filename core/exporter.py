@@ -5,8 +5,9 @@
     - Загрузка конфигурации моделей (<MANAGE_NAME>.xlsx).
     - Проверка актуальности (история + файлы IFC на диске).
     - Группировка моделей по версиям Revit и формирование Task<ver>.txt.
-    - Подготовка временного CSV (<TMP_NAME>.csv) для каждой версии.
-    - Запуск pyRevit CLI по версиям и запись логов проблемных кейсов.
+    - Подготовка временного CSV (<TMP_NAME><ver>.csv) для каждой версии.
+    - Запуск pyRevit CLI по версиям (по очереди или до
+      MAX_PARALLEL_VERSIONS одновременно) и запись логов проблемных кейсов.
 
 Контракты:
     - Сравнение дат файлов RVT/IFC «до минут».
@@ -14,8 +15,8 @@
     - Пути к Task-файлам формируются через config.build_task_path(version).
     - История (<HISTORY_NAME>.xlsx) всегда сохраняется по итогам прогона
       (даже если часть версий завершилась с ошибкой или включён dry-run).
-    - <TMP_NAME>.csv удаляется только при успешном запуске соответствующей
-      версии.
+    - <TMP_NAME><ver>.csv удаляется только при успешном запуске
+      соответствующей версии.
 
 Особенности:
     - run_pyrevit=False (dry-run):
@@ -24,6 +25,7 @@
         * <HISTORY_NAME>.xlsx всё равно обновляется (отражает факт проверки
         моделей программой, а не гарантированно успешного экспорта IFC).
 """
+import os
 import logging
 from datetime import datetime
 from typing import List, Optional
@@ -34,6 +36,7 @@ from config import (
     MANAGE_NAME,
     HISTORY_NAME,
     DIR_ADMIN_DATA,
+    MAX_PARALLEL_VERSIONS,
     build_task_path,
 )
 from config.constants import (
@@ -42,16 +45,25 @@ from config.constants import (
     LOGFILE_OPENING_ERRORS,
 )
 
-from core.models import RevitModel
+from core.models import (
+    RevitModel,
+    batch_needs_export,
+    batch_load_versions,
+)
 from core.manage import ManageDataLoader
 from core.history import HistoryManager
-from core.ifc_checker import IFCChecker
+from core.ifc_checker import IFCChecker, IFCListingCache
 from core.tasks import ExportTaskManager
 from core.pyRevit_runner import PyRevitRunner
+from core.version_cache import VersionCache
 
 from utils.fs import ensure_dir
 from utils.files import format_log_name_with_view
-from utils.logs import write_log_lines, append_log_separator
+from utils.logs import (
+    set_run_date,
+    write_log_lines,
+    append_log_separator,
+)
 
 
 # Модульный логгер: наследует настройки от "export_ifc"
@@ -68,7 +80,9 @@ class ExportOrchestrator:
     Состояние:
         - manage   — загрузчик данных из <MANAGE_NAME>.xlsx;
         - history  — менеджер истории выгрузок (<HISTORY_NAME>.xlsx);
+        - ifc_listing — кэш листингов папок выгрузки IFC за прогон;
         - ifc      — проверка актуальности целевых IFC на диске;
+        - versions — кэш версий Revit для RVT между запусками;
         - taskman  — группировка моделей по версиям и генерация артефактов;
         - runner   — исполнитель вызовов pyRevit (CLI).
 
@@ -94,8 +108,14 @@ class ExportOrchestrator:
         # История выгрузок IFC (<HISTORY_NAME>.xlsx)
         self.history: HistoryManager = HistoryManager()
 
+        # Листинги папок выгрузки IFC (один скан на папку за прогон)
+        self.ifc_listing: IFCListingCache = IFCListingCache()
+
         # Проверка актуальности целевых IFC на диске
-        self.ifc: IFCChecker = IFCChecker()
+        self.ifc: IFCChecker = IFCChecker(self.ifc_listing)
+
+        # Кэш версий RVT (<VERSION_CACHE_NAME>.json в admin_data)
+        self.versions: VersionCache = VersionCache()
 
         # Менеджер задач экспорта (группировка по версиям, Task/CSV,
         # bucket-логи)
@@ -122,7 +142,8 @@ class ExportOrchestrator:
                Task<ver>.txt.
             6. Подготовка <TMP_NAME>.csv и запуск pyRevit по версиям
                (или dry-run).
-            7. Сохранение <HISTORY_NAME>.xlsx и финализация txt-логов pyRevit.
+            7. Сохранение <HISTORY_NAME>.xlsx и кэша версий RVT, финализация
+               txt-логов pyRevit.
 
         Особенности:
             - Ошибки открытия/экспорта отдельных моделей не прерывают цикл:
@@ -141,6 +162,11 @@ class ExportOrchestrator:
         # разделитель в txt-логах добавлялся только при их изменении
         # в текущем запуске
         self._run_started_at = datetime.now()
+        # та же отметка задаёт дату в именах txt-логов — и здесь, и в
+        # процессах pyRevit (через runner), чтобы запуск через полночь
+        # не разрывал логи на два файла
+        set_run_date(self._run_started_at)
+        self.runner.run_date = self._run_started_at
 
         # 1. Загрузка моделей и применение ignore-листа
         models = self._get_filtered_models()
@@ -183,6 +209,9 @@ class ExportOrchestrator:
                 exc_info=True,
             )
 
+        # Кэш версий RVT: ошибки записи не критичны и логируются внутри.
+        self.versions.save()
+
         if any_failures and self.run_pyrevit:
             if history_saved:
                 log.warning(
@@ -261,11 +290,13 @@ class ExportOrchestrator:
             log.info("Моделей после применения ignore-листа: %d", len(models))
             return models
 
-        # Фильтрация по ignore: в manage.ignore хранятся строковые пути,
-        # поэтому приводим rvt_path к str.
+        # Фильтрация по ignore: в manage.ignore хранятся строковые пути
+        # после os.path.normcase, поэтому путь модели приводим так же
+        # (поиск по множеству — O(1) на модель).
+        normcase = os.path.normcase
         models = [
             m for m in models_source
-            if str(m.rvt_path) not in ignore_set
+            if normcase(m.rvt_str) not in ignore_set
         ]
 
         log.info("Моделей после применения ignore-листа: %d", len(models))
@@ -305,7 +336,8 @@ class ExportOrchestrator:
         по версиям.
 
         Назначение:
-            - вызвать RevitModel.needs_export(history, ifc) для каждой модели;
+            - проверить все модели через batch_needs_export(history, ifc)
+              (RevitModel.decide_export() в пуле потоков);
             - отфильтровать модели, для которых экспорт не требуется;
             - для остальных:
                 * определить версию Revit;
@@ -314,37 +346,47 @@ class ExportOrchestrator:
 
         :param models: Список экземпляров RevitModel.
         """
+        # Нужен ли экспорт?
+        #     Логика внутри RevitModel.decide_export():
+        #       - history       → не менялся ли RVT с момента последнего
+        #                         рассмотрения;
+        #       - IFCChecker    → существуют ли актуальные IFC
+        #                         (mapped/nomap).
+        #     Если оба IFC свежие и история совпадает, модель пропускается.
+        #     Проверки идут параллельно, результат — в исходном порядке.
+        # Папки выгрузки сканируем заранее и параллельно (по одному
+        # листингу на папку), чтобы проверки моделей не ждали друг друга.
+        self.ifc_listing.prefetch(
+            folder
+            for m in models
+            for folder in (
+                m.expected_ifc_dir_mapping(),
+                m.expected_ifc_dir_nomap(),
+            )
+        )
+        to_export = batch_needs_export(models, self.history, self.ifc)
 
-        # Счётчик моделей, которым действительно требуется экспорт / проверка.
-        to_export = 0
-
-        for model in models:
-            # Нужен ли экспорт?
-            #     Логика внутри model.needs_export():
-            #       - history       → не менялся ли RVT с момента последнего
-            #                         рассмотрения;
-            #       - IFCChecker    → существуют ли актуальные IFC
-            #                         (mapped/nomap).
-            #     Если оба IFC свежие и история совпадает, модель пропускается.
-            if not model.needs_export(self.history, self.ifc):
-                continue
-
-            to_export += 1
+        # Определяем версии Revit (читает build из RVT и маппит в год;
+        # для неизменённых с прошлого запуска файлов — из кэша).
+        # Чтение заголовков RVT идёт параллельно.
+        batch_load_versions(to_export, self.versions)
 
-            # Определяем версию Revit (читает build из RVT и маппит в год).
-            model.load_version()
+        pairs = []
+        for model in to_export:
             ver = model.version
-
-            # Группируем модель по версии Revit. Внутри add_model уже
-            # есть обработка аномалий (непонятная/неподдерживаемая версия).
-            self.taskman.add_model(model, ver)
+            pairs.append((model, ver))
 
             # История фиксируется только для распознанных версий:
             # если версия не определена, модель не попадает в history.
             if ver is not None:
                 self.history.update_record(model)
 
-        log.info("Моделей, требующих проверки/экспорта: %d", to_export)
+        # Группируем модели по версиям Revit одним проходом. Внутри
+        # add_models уже есть обработка аномалий (непонятная/
+        # неподдерживаемая версия).
+        self.taskman.add_models(pairs)
+
+        log.info("Моделей, требующих проверки/экспорта: %d", len(to_export))
 
     def _log_tasks_summary(self) -> None:
         """Логирует сводку по версиям Revit и количеству моделей в заданиях."""
@@ -372,41 +414,55 @@ class ExportOrchestrator:
         if not self.taskman.tasks:
             return False
 
-        # Флаг, что хотя бы для одной версии pyRevit завершился с ошибкой.
-        any_failures = False
-
         # Обрабатываем версии детерминированно (по возрастанию).
-        for ver in sorted(self.taskman.tasks.keys()):
-            # Путь к Task-файлу для данной версии.
-            task_file = build_task_path(ver)
-            # Временный CSV с заданиями по данной версии (один <TMP_NAME>.csv
-            # на версию).
-            tmp_csv = self.taskman.write_tmp_csv(DIR_ADMIN_DATA, ver)
-
-            if not self.run_pyrevit:
-                # Dry-run: создаём Task и <TMP_NAME>.csv, но не запускаем
-                # pyRevit.
-                # Это удобно для отладки состава заданий и CSV.
+        versions = sorted(self.taskman.tasks.keys())
+
+        # Временные CSV готовим заранее по всем версиям: у каждой версии
+        # свой <TMP_NAME><ver>.csv, поэтому версии pyRevit может
+        # обрабатывать одновременно.
+        tmp_csvs = {
+            ver: self.taskman.write_tmp_csv(DIR_ADMIN_DATA, ver)
+            for ver in versions
+        }
+
+        if not self.run_pyrevit:
+            # Dry-run: создаём Task и <TMP_NAME><ver>.csv, но не запускаем
+            # pyRevit.
+            # Это удобно для отладки состава заданий и CSV.
+            for ver in versions:
                 log.info(
                     "[DRY-RUN] pyRevit для Revit %s не запускается "
                     "(task=%s, csv=%s)",
                     ver,
-                    task_file,
-                    tmp_csv,
+                    build_task_path(ver),
+                    tmp_csvs[ver],
                 )
-                # <TMP_NAME>.csv осознанно сохраняем для анализа.
-                continue
+            # CSV осознанно сохраняем для анализа.
+            return False
 
+        for ver in versions:
             log.info(
                 "Запуск pyRevit для Revit %s (task=%s)",
                 ver,
-                task_file.name,
+                build_task_path(ver).name,
             )
 
-            # rc — код возврата pyRevit CLI:
-            #   0   → условный успех;
-            #  !=0  → что-то пошло не так (код зависит от скрипта/pyRevit).
-            rc = self.runner.run_for_version(ver, task_file)
+        # rc — код возврата pyRevit CLI:
+        #   0   → условный успех;
+        #  !=0  → что-то пошло не так (код зависит от скрипта/pyRevit).
+        # Одновременно обрабатывается до MAX_PARALLEL_VERSIONS версий
+        # (по умолчанию — по очереди).
+        codes = self.runner.run_all(
+            [(ver, build_task_path(ver)) for ver in versions],
+            max_workers=MAX_PARALLEL_VERSIONS,
+        )
+
+        # Флаг, что хотя бы для одной версии pyRevit завершился с ошибкой.
+        any_failures = False
+
+        for ver in versions:
+            rc = codes[ver]
+            tmp_csv = tmp_csvs[ver]
 
             if rc != 0:
                 any_failures = True
@@ -417,7 +473,7 @@ class ExportOrchestrator:
                     rc,
                     tmp_csv.name,
                 )
-                # <TMP_NAME>.csv оставляем на диске для разбора.
+                # CSV оставляем на диске для разбора.
             else:
                 tmp_csv.unlink(missing_ok=True)
                 log.info(
@@ -60,13 +60,18 @@ from config.excel import (
     HISTORY_TBL_NAME,
     HISTORY_COL_RVT_PATH,
     HISTORY_COL_DATETIME,
+    HISTORY_NCOLS,
     FORMAT_DATETIME_EXCEL,
 )
 
 from core.models import RevitModel
 
 from utils.fs import ensure_dir
-from utils.xlsx_helpers import Xlsx
+from utils.xlsx_helpers import (
+    cell as xlsx_cell,
+    is_blank_row,
+    parse_datetime,
+)
 
 # Модульный логгер (наследует конфигурацию от "export_ifc")
 log = logging.getLogger(f"{LOGGER_NAME}.history")
@@ -154,14 +159,18 @@ class HistoryStore:
     """Хранит и управляет записями истории выгрузок (в памяти).
 
     Состояние:
-        - _rows — список всех записей (path, datetime);
-        - _last — dict: путь → последняя (максимальная) дата;
-        - _seen — set для защиты от точных дублей (path, datetime).
+        - _dates — dict: путь → множество дат записей по этому пути;
+        - _last  — dict: путь → последняя (максимальная) дата.
 
     Правила:
         - На один путь может быть несколько записей (история изменений).
         - Последней считается запись с максимальной датой.
         - Дубликаты (один и тот же path + datetime) игнорируются.
+
+    Особенности:
+        - Записи проиндексированы по пути: добавление, проверка и «откат»
+          затрагивают только записи одной модели и не требуют прохода
+          по всей истории.
     """
 
     def __init__(
@@ -172,12 +181,10 @@ class HistoryStore:
 
         :param initial_rows: Итерация пар (путь, дата) для начальной загрузки.
         """
-        # Полный список строк истории (path, dt)
-        self._rows: List[HistoryRow] = []
+        # Даты записей по каждому пути (set защищает от точных дублей)
+        self._dates: Dict[str, set[datetime]] = {}
         # Последняя дата по каждому пути
         self._last: Dict[str, datetime] = {}
-        # Набор для защиты от дублей (path, dt)
-        self._seen: set[HistoryRow] = set()
 
         if initial_rows:
             for path, dt in initial_rows:
@@ -190,14 +197,13 @@ class HistoryStore:
         :param path_str: Путь к модели.
         :param dt:       Дата выгрузки (нормализованная до минут).
         """
-        key = (path_str, dt)
+        dates = self._dates.setdefault(path_str, set())
 
         # Защита от точных дублей (path + datetime).
-        if key in self._seen:
+        if dt in dates:
             return
 
-        self._rows.append(key)
-        self._seen.add(key)
+        dates.add(dt)
         self._last[path_str] = max(dt, self._last.get(path_str, dt))
 
     def is_up_to_date(self, model: RevitModel) -> bool:
@@ -239,40 +245,21 @@ class HistoryStore:
 
     # ----------------------------- внутренние -----------------------------
     def _prune_future_records(self, path: str, threshold: datetime) -> None:
-        """Удаляет записи пути с датой > threshold и пересобирает индекс.
+        """Удаляет записи пути с датой > threshold и обновляет индекс.
 
         :param path:      Путь к модели.
         :param threshold: Верхняя граница даты (текущее состояние модели).
         """
-        # Оставляем только записи:
-        #   - других путей;
-        #   - этого пути, но с датой <= threshold.
-        self._rows = [
-            (p, dt) for (p, dt) in self._rows if p != path or dt <= threshold
-        ]
-
-        # Пересобираем набор seen и индекс последних дат
-        self._seen = set(self._rows)
-        self._reindex_last(path)
-
-    def _reindex_last(self, path: Optional[str] = None) -> None:
-        """Пересчитывает словарь последних дат (_last).
-
-        :param path: Путь для частичного пересчёта (None → полный пересчёт).
-        """
-        if path is not None:
-            # Частичный пересчёт по одному пути
-            dates = [dt for (p, dt) in self._rows if p == path]
-            if dates:
-                self._last[path] = max(dates)
-            else:
-                self._last.pop(path, None)
-            return
+        # Оставляем только записи этого пути с датой <= threshold;
+        # записи других путей не затрагиваются.
+        dates = {dt for dt in self._dates.get(path, ()) if dt <= threshold}
 
-        # Полный пересчёт (используется редко, но оставлен для надёжности)
-        self._last.clear()
-        for p, dt in self._rows:
-            self._last[p] = max(dt, self._last.get(p, dt))
+        if dates:
+            self._dates[path] = dates
+            self._last[path] = max(dates)
+        else:
+            self._dates.pop(path, None)
+            self._last.pop(path, None)
 
     def rows_sorted(self) -> List[HistoryRow]:
         """Возвращает детерминированный список строк (путь ASC, дата DESC).
@@ -282,7 +269,15 @@ class HistoryStore:
 
         :return: Отсортированный список строк истории.
         """
-        return sorted(self._rows, key=lambda t: (t[0], -t[1].timestamp()))
+        # Записи уже сгруппированы по пути (_dates): сортируем только ключи
+        # и даты внутри каждой группы, без общей сортировки всех строк
+        # и без перевода дат в timestamp().
+        dates_by_path = self._dates
+        return [
+            (path, dt)
+            for path in sorted(dates_by_path)
+            for dt in sorted(dates_by_path[path], reverse=True)
+        ]
 
 
 # ----------------------- HistoryXlsxIO -----------------------
@@ -308,7 +303,7 @@ class HistoryXlsxIO:
 
         Поведение:
             - при отсутствии файла истории возвращает пустой список;
-            - читает строки до первой «целиком пустой» (по Xlsx.is_blank_row);
+            - читает строки до первой «целиком пустой» (по is_blank_row);
             - пропускает строки без пути или с некорректной датой, пишет
               предупреждения в лог;
             - гарантирует, что каждая запись содержит нормализованный путь
@@ -342,14 +337,18 @@ class HistoryXlsxIO:
 
             # 4. Обходим строки с 2-й (шапка — 1-я) до первой полностью пустой.
             for row_idx, row in enumerate(
-                ws.iter_rows(min_row=2, values_only=True),
+                ws.iter_rows(
+                    min_row=2,
+                    max_col=HISTORY_NCOLS,
+                    values_only=True,
+                ),
                 start=2,
             ):
-                if Xlsx.is_blank_row(row):
+                if is_blank_row(row):
                     break
 
                 # 4.1. Путь к модели — обязательный столбец A.
-                path_str = Xlsx.cell(row, HISTORY_COL_RVT_PATH)
+                path_str = xlsx_cell(row, HISTORY_COL_RVT_PATH)
                 if not path_str:
                     log.warning(
                         "Лист %s: строка %d пропущена — пустой путь к модели",
@@ -364,7 +363,7 @@ class HistoryXlsxIO:
                 raw_dt = None
                 if row and len(row) > HISTORY_COL_DATETIME:
                     raw_dt = row[HISTORY_COL_DATETIME]
-                    dt_val = Xlsx.parse_datetime(raw_dt)
+                    dt_val = parse_datetime(raw_dt)
 
                 if not dt_val:
                     # Строки с пустой/битой датой пропускаем.
@@ -505,53 +504,39 @@ class HistoryXlsxIO:
         Если записей нет, создаёт скелет второй строки (A2:B2), чтобы
         таблица имела корректный диапазон даже при пустой истории.
 
+        Особенности:
+            - ws.cell и общий объект Alignment берутся в локальные имена
+              один раз: в цикле нет поиска атрибутов и создания стилей
+              на каждую ячейку.
+
         :param ws: Лист Excel, в который выполняется запись.
         :param rows: Итерация строк истории для записи.
         :return: Индекс последней заполненной строки.
         """
-        row_idx = 2
+        cell = ws.cell
+        align = Alignment(horizontal=ALIGN_CELL)
+        col_path = HISTORY_COL_RVT_PATH + 1
+        col_dt = HISTORY_COL_DATETIME + 1
+
+        row_idx = 1
+        for row_idx, (path_str, dt) in enumerate(rows, start=2):
+            # Столбец A — путь к файлу.
+            cell(row_idx, col_path, path_str).alignment = align
 
-        for path_str, dt in rows:
-            HistoryXlsxIO._write_row(ws, row_idx, path_str, dt)
-            row_idx += 1
+            # Столбец B — дата выгрузки.
+            cell_dt = cell(row_idx, col_dt, dt)
+            cell_dt.number_format = FORMAT_DATETIME_EXCEL
+            cell_dt.alignment = align
 
         # Если не было ни одной строки — создаём пустую строку A2:B2.
-        if row_idx == 2:
-            HistoryXlsxIO._write_row(ws, 2, "", None)
+        if row_idx == 1:
+            cell(2, col_path, "").alignment = align
+            cell_dt = cell(2, col_dt, None)
+            cell_dt.number_format = FORMAT_DATETIME_EXCEL
+            cell_dt.alignment = align
             return 2
 
-        return row_idx - 1
-
-    @staticmethod
-    def _write_row(
-        ws: Worksheet,
-        row_idx: int,
-        path_str: Optional[str],
-        dt: Optional[datetime],
-    ) -> None:
-        """Создаёт и оформляет одну строку истории.
-
-        :param ws: Лист Excel, где создаются ячейки.
-        :param row_idx: Индекс строки (2, 3, ...).
-        :param path_str: Путь к модели или пустая строка для «скелета».
-        :param dt: Дата модификации RVT или None для «скелета».
-        """
-        # Столбец A — путь к файлу.
-        cell_path = ws.cell(
-            row=row_idx,
-            column=HISTORY_COL_RVT_PATH + 1,
-            value=path_str,
-        )
-        cell_path.alignment = Alignment(horizontal=ALIGN_CELL)
-
-        # Столбец B — дата выгрузки.
-        cell_dt = ws.cell(
-            row=row_idx,
-            column=HISTORY_COL_DATETIME + 1,
-            value=dt,
-        )
-        cell_dt.number_format = FORMAT_DATETIME_EXCEL
-        cell_dt.alignment = Alignment(horizontal=ALIGN_CELL)
+        return row_idx
 
     # ------------------------- таблица и автофильтр -------------------------
 
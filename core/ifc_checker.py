@@ -12,50 +12,186 @@
     - IFC считается актуальным, если его mtime (округлённый до минут)
       не меньше, чем last_modified у RVT (также до минут).
     - is_ifc_up_to_date_mapping(model):
-        * expected_ifc_path_mapping() вернул Path:
-              → проверяем существование и «свежесть» файла;
-        * expected_ifc_path_mapping() вернул None:
+        * expected_ifc_dir_mapping() вернул Path:
+              → проверяем существование и «свежесть» <name>.ifc в папке;
+        * expected_ifc_dir_mapping() вернул None:
               → экспорт по mapped-направлению не настроен → False.
     - is_ifc_up_to_date_nomap(model):
-        * expected_ifc_path_nomap() вернул None:
+        * expected_ifc_dir_nomap() вернул None:
               → для модели nomap-выгрузка не требуется (либо глобально
                 выключена, либо не настроена) → считаем условие выполненным,
                 возвращаем True;
         * иначе проверяем существование и «свежесть» файла.
 
 Особенности:
-    - Для ускорения используется кэш по папкам:
-        * {папка: {имя_файла: mtime(datetime, до минут)}}.
-      Кэш лениво заполняется при первом обращении к папке.
-    - Поиск файлов по маскам IFC_PATTERNS (по умолчанию только "*.ifc").
+    - Для ускорения используется индекс по папкам:
+        * {папка: {имя_без_расширения: os.DirEntry}}.
+      Индекс лениво заполняется одним os.scandir() при первом обращении
+      к папке: существование IFC — это поиск по словарю по паре
+      (папка, model.name) без stat() и без построения пути к IFC.
+    - Индекс служит и «отрицательным» кэшем: известное отсутствие IFC
+      (нет имени в индексе, нет папки) повторно с диском не сверяется.
+      Неудачный stat() тоже запоминается (None в _mtimes).
+    - stat() выполняется только для найденных IFC, когда нужно сравнить
+      даты, и не более одного раза на файл за прогон (кэш _mtimes).
+      Берётся os.DirEntry.stat(): на Windows он заполняется из данных
+      листинга папки без отдельного системного вызова и без Path.
+    - Кэш не сбрасывается: все проверки IFC выполняются до запуска
+      pyRevit, после выгрузки листинги повторно не читаются.
+    - IFC-файлы отбираются по расширениям IFC_SUFFIXES (по умолчанию
+      только ".ifc", без учёта регистра).
+    - Листинги папок хранит IFCListingCache — один на прогон оркестратора
+      (передаётся в IFCChecker); проверки потокобезопасны: каждая папка
+      сканируется один раз даже при параллельных вызовах
+      (см. core.models.batch_needs_export).
     - Ошибки доступа к файловой системе трактуются как «IFC не актуален»
       (возвращаем False, логируем на уровне debug).
 """
+import os
 import logging
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
 
 from config import LOGGER_NAME
 
 from core.models import RevitModel
 
-from utils.fs import file_mtime_minute
+from utils.fs import mtime_minute
 
 # Модульный логгер
 log = logging.getLogger(f"{LOGGER_NAME}.ifc_checker")
 
-# Маски IFC-файлов (при необходимости можно расширить)
-IFC_PATTERNS: tuple[str, ...] = ("*.ifc",)
+# Расширения IFC-файлов в нижнем регистре (при необходимости можно
+# расширить)
+IFC_SUFFIXES: tuple[str, ...] = (".ifc",)
+
+# Число потоков для предварительного сканирования папок выгрузки
+PREFETCH_WORKERS = 16
 
 # Метки для логов проверки IFC
 LOG_LABEL_MAPPED = "Mapped-IFC"
 LOG_LABEL_NOMAP = "Nomap-IFC"
 
-# Кэш по одной папке: имя файла → время модификации (до минут)
-FolderCache = Dict[str, datetime]
-# Общий кэш: папка → FolderCache
-IFCCache = Dict[Path, FolderCache]
+# Индекс одной папки: имя файла без расширения → запись os.scandir()
+# (полный путь в entry.path, stat() берётся из данных листинга)
+FolderIndex = Dict[str, os.DirEntry]
+# Общий индекс: папка → FolderIndex
+IFCIndex = Dict[Path, FolderIndex]
+
+
+class IFCListingCache:
+    """Кэш листингов IFC-папок на один прогон оркестратора.
+
+    Назначение:
+        - Сканировать каждую папку выгрузки не более одного раза за прогон
+          (папки выгрузки не меняются до запуска pyRevit).
+
+    Состояние:
+        - _index: IFCIndex — имена IFC-файлов по папкам;
+        - _locks: блокировки по папкам (одно сканирование на папку при
+          параллельных проверках).
+
+    Методы:
+        - files_in(folder)  -> FolderIndex
+        - prefetch(folders) -> None
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует пустой кэш листингов.
+
+        Структура индекса:
+            - {папка: {имя_без_расширения: os.DirEntry}}.
+        """
+        self._index: IFCIndex = {}
+        self._locks: Dict[Path, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    # ----------------------------- публичный API -----------------------------
+    def files_in(self, folder: Path) -> FolderIndex:
+        """Возвращает индекс IFC-файлов папки (сканирует папку один раз).
+
+        :param folder: Папка с IFC-файлами.
+        :return: FolderIndex для указанной папки.
+        """
+        # Быстрый путь: папка уже просканирована.
+        index = self._index.get(folder)
+        if index is not None:
+            return index
+
+        # Повторная проверка под блокировкой: папку мог уже просканировать
+        # параллельный поток.
+        with self._folder_lock(folder):
+            index = self._index.get(folder)
+            if index is None:
+                index = self._scan_folder(folder)
+                self._index[folder] = index
+
+        return index
+
+    def prefetch(
+        self,
+        folders: Iterable[Optional[Path]],
+        workers: int = PREFETCH_WORKERS,
+    ) -> None:
+        """Параллельно сканирует ещё не просканированные папки.
+
+        Листинги сетевых папок — отдельные обращения к серверу, поэтому
+        разные папки сканируются одновременно, а последующие проверки
+        моделей берут готовый индекс.
+
+        :param folders: Папки выгрузки (None и повторы пропускаются).
+        :param workers: Максимальное число потоков.
+        """
+        pending = [
+            f for f in dict.fromkeys(folders)
+            if f is not None and f not in self._index
+        ]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(pending))
+        ) as pool:
+            # list() — дожидаемся всех сканирований.
+            list(pool.map(self.files_in, pending))
+
+    # ----------------------------- внутренние -----------------------------
+    def _folder_lock(self, folder: Path) -> threading.Lock:
+        """Возвращает блокировку для сканирования указанной папки.
+
+        :param folder: Папка с IFC-файлами.
+        :return: Блокировка, общая для всех потоков.
+        """
+        with self._locks_guard:
+            return self._locks.setdefault(folder, threading.Lock())
+
+    @staticmethod
+    def _scan_folder(folder: Path) -> FolderIndex:
+        """Собирает индекс IFC-файлов папки одним проходом os.scandir().
+
+        :param folder: Папка с IFC-файлами.
+        :return: FolderIndex (пустой, если папки нет или она недоступна).
+        """
+        index: FolderIndex = {}
+
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    # Сначала дешёвая проверка расширения; is_file() берёт
+                    # тип из листинга (подпапка "*.ifc" — не IFC-файл).
+                    if ext.lower() in IFC_SUFFIXES and entry.is_file():
+                        index[stem] = entry
+        except FileNotFoundError:
+            # Папка экспорта отсутствует: логируем и считаем, что IFC нет.
+            log.debug("Папка IFC не существует: %s", folder)
+        except OSError as exc:
+            log.debug("Не удалось прочитать папку IFC %s: %s", folder, exc)
+
+        return index
 
 
 class IFCChecker:
@@ -67,7 +203,9 @@ class IFCChecker:
             * IFC без маппинга (nomap).
 
     Состояние:
-        - _cache: IFCCache — кэш времени модификации IFC-файлов по папкам.
+        - listing: IFCListingCache — листинги IFC-папок за прогон;
+        - _mtimes: время модификации (до минут) уже проверенных IFC
+          по полному пути (None — stat() не удался).
 
     Методы:
         - is_ifc_up_to_date_mapping(model: RevitModel) -> bool
@@ -79,14 +217,14 @@ class IFCChecker:
           принимается в RevitModel.needs_export().
     """
 
-    def __init__(self) -> None:
-        """Инициализирует кэш по папкам для IFC-файлов.
+    def __init__(self, listing: Optional[IFCListingCache] = None) -> None:
+        """Инициализирует проверку поверх кэша листингов папок.
 
-        Структура кэша:
-            - {папка: {имя_файла: mtime}},
-              где mtime — datetime, нормализованный до минут.
+        :param listing: Кэш листингов IFC-папок на прогон (если не задан,
+                        создаётся собственный).
         """
-        self._cache: IFCCache = {}
+        self.listing: IFCListingCache = listing or IFCListingCache()
+        self._mtimes: Dict[str, Optional[datetime]] = {}
 
     # ----------------------------- публичный API -----------------------------
     def is_ifc_up_to_date_mapping(self, model: RevitModel) -> bool:
@@ -96,7 +234,7 @@ class IFCChecker:
         :return: True, если mapped-IFC существует и не старее RVT.
         """
         return self._check_ifc(
-            path=model.expected_ifc_path_mapping(),
+            folder=model.expected_ifc_dir_mapping(),
             model=model,
             log_label=LOG_LABEL_MAPPED,
             none_means_fresh=False,
@@ -110,7 +248,7 @@ class IFCChecker:
                  и не старее RVT.
         """
         return self._check_ifc(
-            path=model.expected_ifc_path_nomap(),
+            folder=model.expected_ifc_dir_nomap(),
             model=model,
             log_label=LOG_LABEL_NOMAP,
             none_means_fresh=True,
@@ -119,7 +257,7 @@ class IFCChecker:
     # ------------------------ внутренняя логика ------------------------
     def _check_ifc(
         self,
-        path: Optional[Path],
+        folder: Optional[Path],
         model: RevitModel,
         log_label: str,
         none_means_fresh: bool,
@@ -127,14 +265,14 @@ class IFCChecker:
         """Общая проверка для mapped/nomap-IFC.
 
         Поведение:
-            - path is None:
+            - folder is None:
                 * при none_means_fresh=True условие считается выполненным;
                 * при none_means_fresh=False считаем, что IFC не настроен.
-            - path not None:
+            - folder not None:
                 * вызывается _is_fresh() и пишется debug-лог при устаревшем
                   или отсутствующем IFC.
 
-        :param path: Ожидаемый путь к IFC-файлу или None.
+        :param folder: Папка, в которой ожидается IFC-файл, или None.
         :param model: Экземпляр RevitModel (используется для логов и дат).
         :param log_label: Текстовая метка для логов
                           ("Mapped-IFC" / "Nomap-IFC").
@@ -143,7 +281,7 @@ class IFCChecker:
         :return: True, если условие актуальности по данному направлению
                  считается выполненным.
         """
-        if path is None:
+        if folder is None:
             if none_means_fresh:
                 # Для этой модели nomap-выгрузка не нужна → условие считаем
                 # выполненным.
@@ -162,40 +300,48 @@ class IFCChecker:
             return False
 
         # Путь задан — проверяем фактическую «свежесть» IFC относительно RVT.
-        fresh = self._is_fresh(path, model.last_modified)
+        fresh = self._is_fresh(folder, model.name, model.last_modified)
         if not fresh:
             # Для устаревшего/отсутствующего IFC фиксируем детальный debug-лог.
             log.debug(
                 "%s устарел или отсутствует: %s (RVT mtime=%s)",
                 log_label,
-                path,
+                os.path.join(folder, model.name + ".ifc"),
                 model.last_modified,
             )
         return fresh
 
-    def _is_fresh(self, ifc_path: Path, rvt_mtime: datetime) -> bool:
+    def _is_fresh(
+        self,
+        folder: Path,
+        name: str,
+        rvt_mtime: datetime,
+    ) -> bool:
         """Проверяет, что IFC существует и его mtime (до минут) >= rvt_mtime.
 
-        :param ifc_path: Ожидаемый путь к IFC-файлу.
+        Особенности:
+            - Существование файла отдельно не проверяется: индекс папки
+              заполняется одним проходом os.scandir(), и отсутствие имени
+              в индексе означает, что IFC нет.
+
+        :param folder: Папка, в которой ожидается IFC-файл.
+        :param name: Имя IFC-файла без расширения (имя модели).
         :param rvt_mtime: Время модификации RVT (уже нормализовано до минут).
         :return: True, если файл IFC существует и не старее RVT.
         """
-        if not ifc_path.exists():
-            log.debug("IFC-файл не найден: %s", ifc_path)
-            return False
-
-        ifc_mtime = self._cached_mtime(ifc_path)
+        ifc_mtime = self._cached_mtime(folder, name)
         if ifc_mtime is None:
             log.debug(
-                "Не удалось получить время модификации IFC-файла: %s",
-                ifc_path,
+                "IFC-файл не найден или не удалось получить его время "
+                "модификации: %s",
+                os.path.join(folder, name + ".ifc"),
             )
             return False
 
         if ifc_mtime < rvt_mtime:
             log.debug(
                 "IFC-файл старее RVT: %s (IFC=%s < RVT=%s)",
-                ifc_path,
+                os.path.join(folder, name + ".ifc"),
                 ifc_mtime,
                 rvt_mtime,
             )
@@ -204,79 +350,29 @@ class IFCChecker:
         # Сравниваем «минуты к минутам»
         return True
 
-    def _cached_mtime(self, path: Path) -> Optional[datetime]:
-        """Возвращает mtime файла из кэша папки (или обновляет кэш).
+    def _cached_mtime(self, folder: Path, name: str) -> Optional[datetime]:
+        """Возвращает mtime IFC-файла (с ленивым заполнением индекса папки).
 
-        :param path: Путь к файлу .ifc.
+        :param folder: Папка с IFC-файлами.
+        :param name: Имя IFC-файла без расширения.
         :return: datetime (нормализован до минут) или None при
                  ошибке/отсутствии файла.
         """
-        folder = path.parent
-        name = path.name
-
-        # Быстрый путь: кэш по папке уже есть.
-        folder_cache = self._cache.get(folder)
-        if folder_cache is not None:
-            return folder_cache.get(name)
-
-        # Кэша нет — собираем его для всей папки единым проходом.
-        folder_cache = {}
-
-        if not folder.exists():
-            # Папка экспорта отсутствует: логируем и считаем, что IFC нет.
-            log.debug("Папка IFC не существует: %s", folder)
-            self._cache[folder] = folder_cache
+        entry = self.listing.files_in(folder).get(name)
+        if entry is None:
+            # Файла нет в листинге папки — stat() не нужен.
             return None
 
-        for f in self._iter_ifc_files(folder, patterns=IFC_PATTERNS):
-            dt = file_mtime_minute(f)
-            if dt is None:
-                # Например, нет доступа к файлу или stat() упал.
-                log.debug(
-                    "Не удалось получить mtime IFC-файла, пропускаем "
-                    "при кэшировании: %s",
-                    f,
-                )
-                continue
-            # Записываем данные отдельного файла
-            folder_cache[f.name] = dt
+        path = entry.path
+        if path in self._mtimes:
+            return self._mtimes[path]
 
-        self._cache[folder] = folder_cache
-        return folder_cache.get(name)
+        try:
+            dt: Optional[datetime] = mtime_minute(entry.stat().st_mtime)
+        except OSError:
+            # Например, нет доступа к файлу или stat() упал.
+            log.debug("Не удалось получить mtime IFC-файла: %s", path)
+            dt = None
 
-    @staticmethod
-    def _iter_ifc_files(
-        folder: Path,
-        patterns: Iterable[str],
-    ) -> Iterable[Path]:
-        """Итерирует IFC-файлы по нескольким маскам с сортировкой по имени.
-
-        Особенности:
-            - Используются glob-паттерны из `patterns`;
-            - Если папка не существует или пуста — вернётся пустой генератор;
-            - Дубликаты (по разным маскам) убираются через set();
-            - Порядок детерминирован: sorted() по имени файла.
-
-        :param folder: Папка, где ищем файлы IFC.
-        :param patterns: Маски (например, ("*.ifc",)).
-        :return: Итератор по путям IFC-файлов.
-        """
-        # Гарантируем одинаковый порядок при каждом запуске
-        files: list[Path] = []
-        for pat in patterns:
-            files.extend(folder.glob(pat))
-        return (p for p in sorted(set(files)))
-
-    # ------------------- будущие расширения (идеи) -------------------
-    def __reset_cache(self) -> None:
-        """
-        Полностью сбрасывает кэш (например, перед новым крупным прогоном).
-        """
-        self._cache.clear()
-
-    def __invalidate_folder(self, folder: Path) -> None:
-        """Очищает кэш для указанной папки.
-
-        :param folder: Папка, для которой нужно сбросить кэш.
-        """
-        self._cache.pop(folder, None)
+        self._mtimes[path] = dt
+        return dt
@@ -10,14 +10,17 @@
 
 Контракты:
     - Используются листы SHEET_PATH и SHEET_IGNORE (имена заданы в config).
-    - Строки листов читаются последовательно до первой полностью пустой.
+    - Строки листов читаются последовательно до первой полностью пустой
+      (в пределах колонок схемы: MANAGE_NCOLS / MANAGE_IGNORE_NCOLS;
+      столбцы правее не читаются).
     - Столбцы интерпретируются согласно индексам в config.excel.
     - JSON-конфигурация маппинга и файл сопоставления категорий
       (family-mapping txt) обязаны существовать на диске:
         * при отсутствии любого из них выбрасывается
         FileNotFoundError/IsADirectoryError.
     - Папки для выгрузки IFC создаются при необходимости (ensure_dir).
-    - Время модификации RVT нормализуется до минут (file_mtime_minute).
+    - Время модификации RVT нормализуется до минут (mtime_minute по
+      stat() из листинга os.scandir).
 
 Особенности:
     - Глобальный флаг FLAG_UNMAPPED управляет секцией выгрузки без маппинга
@@ -25,10 +28,12 @@
     - Модуль ничего не пишет в файлы сам по себе — он только формирует
       в памяти структуру данных для последующих шагов.
 """
+import os
 import logging
 import openpyxl
 from pathlib import Path
-from dataclasses import dataclass
+from datetime import datetime
+from dataclasses import dataclass, replace
 from typing import Set, List, Optional, Iterable
 
 from config import (
@@ -51,13 +56,15 @@ from config.excel import (
     MANAGE_COL_FAMILY_MAP,
     MANAGE_COL_NOMAP_NAME,
     MANAGE_IGNORE_COL_PATH,
+    MANAGE_NCOLS,
+    MANAGE_IGNORE_NCOLS,
 )
 
 from core.models import RevitModel
 
-from utils.xlsx_helpers import Xlsx
+from utils.xlsx_helpers import cell as xlsx_cell, is_blank_row
 from utils.files import ensure_ext, is_pure_rvt
-from utils.fs import ensure_dir, file_mtime_minute
+from utils.fs import ensure_dir, mtime_minute, resolve_if_exists
 
 # Модульный логгер: наследует настройки от "export_ifc"
 log = logging.getLogger(f"{LOGGER_NAME}.manage")
@@ -68,7 +75,8 @@ class ManageDataLoader:
 
     Состояние/результат:
         - models       — список RevitModel (по всем найденным .rvt);
-        - ignore       — множество путей-исключений (строки, как в Excel);
+        - ignore       — множество путей-исключений (нормализованные строки,
+                         os.path.normcase);
         - models_mtime — сообщения о недоступном/пропущенном mtime.
 
     Правила:
@@ -88,7 +96,8 @@ class ManageDataLoader:
 
         # Список моделей для выгрузки
         self.models: List[RevitModel] = []
-        # Множество путей-исключений (строки, как в листе SHEET_IGNORE)
+        # Множество путей-исключений (нормализованные строки путей из
+        # листа SHEET_IGNORE, без учёта регистра на Windows)
         self.ignore: Set[str] = set()
         # Сообщения о недоступном/пропущенном mtime
         self.models_mtime: List[str] = []
@@ -159,12 +168,12 @@ class ManageDataLoader:
 
         # Идём построчно, начиная со 2-й строки (1-я — шапка).
         for row_idx, row in enumerate(
-            ws.iter_rows(min_row=2, values_only=True),
+            ws.iter_rows(min_row=2, max_col=MANAGE_NCOLS, values_only=True),
             start=2,
         ):
             # Первая полностью пустая строка — сигнал остановки:
             # дальше данных по договорённости быть не должно.
-            if Xlsx.is_blank_row(row):
+            if is_blank_row(row):
                 break
 
             # Парсим строку в нормализованный конфиг _RowCfg.
@@ -195,10 +204,18 @@ class ManageDataLoader:
             # Гарантируем существование выходных папок перед сбором задач.
             self._prepare_output_dirs(cfg)
 
+            # Общие для всех моделей строки пути нормализуем один раз
+            # (а не в __post_init__ каждой RevitModel).
+            cfg = cfg.resolved()
+
             # Перебираем только «чистые» .rvt (без временных/копий).
-            for rvt in self._iter_rvt_files(cfg.rvt_dir):
-                # Нормализуем mtime до минут.
-                mtime = file_mtime_minute(rvt)
+            for entry in self._iter_rvt_files(cfg.rvt_dir):
+                rvt = Path(entry.path)
+
+                # Нормализуем mtime до минут. stat() берём у записи
+                # листинга: на Windows он уже получен вместе с ним,
+                # и файл повторно не опрашивается.
+                mtime = _entry_mtime_minute(entry)
                 if not mtime:
                     # Если не удалось прочитать время модификации —
                     # сохраняем сообщение и пропускаем модель.
@@ -209,15 +226,18 @@ class ManageDataLoader:
 
                 # Собираем RevitModel — это ключевая структура,
                 # которая дальше пойдёт в Orchestrator/History/IFCChecker.
+                # Пути уже нормализованы: rvt лежит в разрешённой rvt_dir,
+                # пути конфига — после cfg.resolved().
                 self.models.append(
                     RevitModel(
-                        rvt_path=rvt,
+                        rvt_path=_lower_suffix(rvt),
                         last_modified=mtime,
                         output_dir_mapping=cfg.out_map_dir,
                         output_dir_nomap=cfg.out_nomap_dir,
                         mapping_json=cfg.mapping_json,
                         nomap_json=cfg.nomap_json,
                         family_mapping_file=cfg.family_mapping_file,
+                        normalized=True,
                     )
                 )
 
@@ -243,8 +263,8 @@ class ManageDataLoader:
                      строка/значение и она интерпретируется как
                      абсолютный путь; иначе None.
             """
-            # Xlsx.cell: безопасно берёт ячейку (обрезка/strip/None)
-            s = Xlsx.cell(row, idx)
+            # xlsx_cell: безопасно берёт ячейку (обрезка/strip/None)
+            s = xlsx_cell(row, idx)
             if not s:
                 return None
 
@@ -306,7 +326,7 @@ class ManageDataLoader:
 
         # Имя txt-файла сопоставления категорий (D) →
         # лежит в DIR_MAPPING_LAYERS под DIR_EXPORT_CONFIG.
-        fam = Xlsx.cell(row, MANAGE_COL_FAMILY_MAP)
+        fam = xlsx_cell(row, MANAGE_COL_FAMILY_MAP)
         if not fam:
             # Без файла маппинга категорий строка не берется.
             return None
@@ -325,7 +345,7 @@ class ManageDataLoader:
         if FLAG_UNMAPPED:
             # Папка назначения (E) + имя json-конфига (F) из DIR_MAPPING_COMMON
             out_nomap_dir = opt_path(MANAGE_COL_OUT_NOMAP)
-            nomap_name = Xlsx.cell(row, MANAGE_COL_NOMAP_NAME)
+            nomap_name = xlsx_cell(row, MANAGE_COL_NOMAP_NAME)
 
             has_dir = out_nomap_dir is not None
             has_json_name = bool(nomap_name)
@@ -384,19 +404,40 @@ class ManageDataLoader:
         if FLAG_UNMAPPED and cfg.out_nomap_dir:
             ensure_dir(cfg.out_nomap_dir)
 
-    def _iter_rvt_files(self, rvt_dir: Path) -> Iterable[Path]:
+    def _iter_rvt_files(self, rvt_dir: Path) -> Iterable[os.DirEntry]:
         """Итерирует только корректные .rvt-файлы в заданной папке.
 
+        Особенности:
+            - Папка читается одним os.scandir(): без построения Path на
+              каждый файл и без отдельного stat() для is_file (на Windows
+              тип и атрибуты приходят вместе с листингом).
+            - Недоступная папка не прерывает загрузку: предупреждение
+              в лог и пустой результат.
+
         :param rvt_dir: Папка с исходными Revit-моделями.
-        :return: Итератор по допустимым .rvt-файлам (без временных
-                 и «копий»).
+        :return: Итератор по записям os.DirEntry допустимых .rvt-файлов
+                 (без временных и «копий»).
         """
-        # Сортировка для детерминированного порядка экспорта.
-        for path in sorted(rvt_dir.glob("*.rvt")):
-            # is_file — пропускает файлы.
-            # is_pure_rvt — отсекает временные/копии/ненужные варианты.
-            if path.is_file() and is_pure_rvt(path):
-                yield path
+        try:
+            with os.scandir(rvt_dir) as it:
+                entries = [
+                    e for e in it
+                    # is_pure_rvt — отсекает временные/копии/ненужные
+                    # варианты (в т.ч. расширение .rvt в любом регистре);
+                    # is_file — пропускает папки.
+                    if is_pure_rvt(e.name) and e.is_file()
+                ]
+        except OSError as exc:
+            # Нет папки, нет доступа, отвалился сетевой диск — пропускаем
+            # одну строку листа, а не весь запуск (как прежде с glob()).
+            log.warning("Не удалось прочитать папку RVT %s: %s", rvt_dir, exc)
+            return []
+
+        # Сортировка для детерминированного порядка экспорта
+        # (как у путей Path: на Windows — без учёта регистра).
+        normcase = os.path.normcase
+        entries.sort(key=lambda e: normcase(e.name))
+        return entries
 
     def _read_ignore(self, wb: openpyxl.Workbook) -> None:
         """Читает лист SHEET_IGNORE и формирует множество путей-исключений.
@@ -417,12 +458,17 @@ class ManageDataLoader:
 
         # Идём построчно, начиная со 2-й строки (1-я — шапка).
         for row_idx, row in enumerate(
-            ws.iter_rows(min_row=2, values_only=True), start=2
+            ws.iter_rows(
+                min_row=2,
+                max_col=MANAGE_IGNORE_NCOLS,
+                values_only=True,
+            ),
+            start=2,
         ):
-            if Xlsx.is_blank_row(row):
+            if is_blank_row(row):
                 break
 
-            path_str = Xlsx.cell(row, MANAGE_IGNORE_COL_PATH)
+            path_str = xlsx_cell(row, MANAGE_IGNORE_COL_PATH)
 
             if not path_str:
                 # если пустота - пропуск
@@ -447,11 +493,13 @@ class ManageDataLoader:
             if resolved.suffix:
                 resolved = resolved.with_suffix(resolved.suffix.lower())
 
-            self.ignore.add(str(resolved))
+            # normcase: на Windows сравнение путей без учёта регистра
+            # и вида разделителей (проверка — по тому же правилу).
+            self.ignore.add(os.path.normcase(resolved))
 
 
 # ------------------ Дополнительные классы/функции ------------------
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _RowCfg:
     """Нормализованные данные одной строки Excel листа SHEET_PATH.
 
@@ -467,6 +515,44 @@ class _RowCfg:
     family_mapping_file: Path
     nomap_json: Optional[Path]
 
+    def resolved(self) -> "_RowCfg":
+        """Возвращает копию конфига с путями, нормализованными через
+        resolve_if_exists (как в RevitModel.__post_init__).
+
+        :return: Новый экземпляр _RowCfg.
+        """
+        return replace(
+            self,
+            out_map_dir=resolve_if_exists(self.out_map_dir),
+            out_nomap_dir=resolve_if_exists(self.out_nomap_dir),
+            mapping_json=resolve_if_exists(self.mapping_json),
+            family_mapping_file=resolve_if_exists(self.family_mapping_file),
+            nomap_json=resolve_if_exists(self.nomap_json),
+        )
+
+
+def _entry_mtime_minute(entry: os.DirEntry) -> Optional[datetime]:
+    """Возвращает время модификации записи os.scandir(), округлённое до минут.
+
+    :param entry: Запись листинга папки.
+    :return: datetime без секунд/микросекунд или None при ошибке stat().
+    """
+    try:
+        return mtime_minute(entry.stat().st_mtime)
+    except OSError:
+        return None
+
+
+def _lower_suffix(path: Path) -> Path:
+    """Приводит расширение пути к нижнему регистру (".RVT" → ".rvt").
+
+    :param path: Путь к файлу.
+    :return: Тот же путь, если расширение уже в нижнем регистре.
+    """
+    suffix = path.suffix
+    lower = suffix.lower()
+    return path if suffix == lower else path.with_suffix(lower)
+
 
 def _ensure_exists(path: Path, what: str) -> None:
     """Проверяет, что путь существует и является файлом.
@@ -16,6 +16,9 @@
           (Path.resolve());
         * для несуществующих путей остаются без изменений;
         * None не трогаем.
+    - normalized=True означает, что пути уже нормализованы вызывающим
+      кодом (ManageDataLoader), и повторный resolve (stat() на каждый
+      путь) пропускается.
     - Сравнение актуальности выполняется через:
         * HistoryLike.is_up_to_date(self)   — история экспорта;
         * IFCCheckerLike.is_ifc_up_to_date* — наличие/свежесть IFC на диске.
@@ -29,21 +32,46 @@
       задано (строки без него игнорируются), но в процессе работы объекта
       может стать None после needs_export().
     - Версия Revit и build извлекаются лениво методом load_version()
-      через RevitVersionInfo.
+      через RevitVersionInfo (или через кэш версий VersionCacheLike).
     - FLAG_UNMAPPED управляет сценарием «без маппинга».
 """
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Protocol
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Protocol, Sequence, Tuple
+from dataclasses import InitVar, dataclass, field
 
 from config import FLAG_UNMAPPED
 
 from utils.fs import resolve_if_exists
 from revit.versions import RevitVersionInfo
 
+# Число потоков для параллельных проверок актуальности моделей
+# (проверки упираются в файловую систему, а не в CPU).
+EXPORT_CHECK_WORKERS = 16
+
 
 # ----------------------------- протоколы -----------------------------
+class VersionCacheLike(Protocol):
+    """Минимальный протокол для кэша версий Revit.
+
+    Ожидается реализация метода:
+        - get_version(rvt_path: Path) -> Optional[Tuple[int, Optional[str]]]
+    """
+
+    def get_version(
+        self,
+        rvt_path: Path,
+    ) -> Optional[Tuple[int, Optional[str]]]:
+        """Возвращает (год, build) модели.
+
+        :param rvt_path: Путь к файлу .rvt.
+        :return: Кортеж (year, build) или None, если версия не определена.
+        """
+        ...
+
+
 class HistoryLike(Protocol):
     """Минимальный протокол для менеджера истории.
 
@@ -192,12 +220,28 @@ class RevitModel:
     # JSON для «без маппинга» (если включено)
     nomap_json: Optional[Path] = None
 
+    # Пути уже нормализованы вызывающим кодом (только для конструктора)
+    normalized: InitVar[bool] = False
+
+    # Кэш производных от rvt_path: (путь, str(путь), stem). Действителен,
+    # пока rvt_path — тот же объект; новое присваивание rvt_path
+    # сбрасывает его (см. _rvt_parts).
+    _rvt_cache: Optional[Tuple[Path, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # ---------------------- инициализация ----------------------
-    def __post_init__(self) -> None:
+    def __post_init__(self, normalized: bool) -> None:
         """Нормализует только уже известные пути, приводя их к абсолютным.
 
         Если какое-то поле равно None — не трогаем его.
+
+        :param normalized: True — пути уже нормализованы (resolve
+                           пропускается).
         """
+        if normalized:
+            return
+
         # Обязательные пути
         self.rvt_path = resolve_if_exists(self.rvt_path)
         self.output_dir_mapping = resolve_if_exists(self.output_dir_mapping)
@@ -215,16 +259,43 @@ class RevitModel:
 
         :return: Имя файла модели без расширения.
         """
-        return self.rvt_path.stem
+        return self._rvt_parts()[2]
+
+    @property
+    def rvt_str(self) -> str:
+        """Путь к модели строкой (ключ сортировки, строки Task/CSV).
+
+        :return: Путь к файлу модели строкой.
+        """
+        return self._rvt_parts()[1]
+
+    def _rvt_parts(self) -> Tuple[Path, str, str]:
+        """Возвращает (rvt_path, str(rvt_path), stem) из кэша.
+
+        Кэш привязан к объекту rvt_path (Path неизменяем): если поле
+        переприсвоено, значения вычисляются заново.
+
+        :return: Кортеж (путь, путь строкой, имя без расширения).
+        """
+        cache = self._rvt_cache
+        path = self.rvt_path
+        if cache is None or cache[0] is not path:
+            cache = (path, os.fspath(path), path.stem)
+            self._rvt_cache = cache
+        return cache
 
     # --------------------- основная логика ---------------------
-    def load_version(self, strict: bool = False) -> None:
+    def load_version(
+        self,
+        strict: bool = False,
+        cache: Optional[VersionCacheLike] = None,
+    ) -> None:
         """Загружает версию Revit и номер сборки через RevitVersionInfo.
 
         Поведение:
             - Если версия уже определена (self.version не None) — выходим.
-            - Иначе читаем файл .rvt, извлекаем (год, build) и сохраняем
-              в self.version и self.build.
+            - Иначе извлекаем (год, build) — из кэша версий, если он передан,
+              или читая файл .rvt — и сохраняем в self.version и self.build.
             - strict=True  → выбрасываем ValueError, если определить версию
               не удалось (info is None).
             - strict=False → тихо выходим, оставляя self.version/self.build
@@ -234,12 +305,16 @@ class RevitModel:
             - Заполняет/обновляет self.version (int) и self.build (str | None).
 
         :param strict: Режим строгости при отсутствии версии.
+        :param cache: Кэш версий между запусками (None → всегда читать RVT).
         """
         if self.version is not None:
             return
 
-        # Получаем (год, build) через RevitVersionInfo.as_tuple()
-        info = RevitVersionInfo(self.rvt_path).as_tuple()
+        # Получаем (год, build) из кэша или через RevitVersionInfo.as_tuple()
+        if cache is not None:
+            info = cache.get_version(self.rvt_path)
+        else:
+            info = RevitVersionInfo(self.rvt_path).as_tuple()
         if info is None:
             if strict:
                 raise ValueError(
@@ -305,8 +380,18 @@ class RevitModel:
         :return: True, если требуется экспорт модели (по хотя бы одному
                  из направлений mapped/nomap).
         """
-        decision = self.decide_export(history, ifc_checker)
+        return self.apply_decision(self.decide_export(history, ifc_checker))
 
+    def apply_decision(self, decision: ExportDecision) -> bool:
+        """Применяет результат decide_export() к состоянию модели.
+
+        Если по направлению (mapped/nomap) IFC актуален или не нужен,
+        соответствующий output_dir_* обнуляется (None).
+
+        :param decision: Результат decide_export() для этой модели.
+        :return: True, если требуется экспорт модели (по хотя бы одному
+                 из направлений mapped/nomap).
+        """
         # «Отрубаем» те выгрузки, которые уже не нужны
         if decision.ifc_map_ok:
             self.output_dir_mapping = None
@@ -316,6 +401,26 @@ class RevitModel:
         return decision.needs_any_export
 
     # ---------------------- ожидаемые пути IFC ----------------------
+    def expected_ifc_dir_mapping(self) -> Optional[Path]:
+        """Папка, в которой ожидается IFC с маппингом.
+
+        :return: output_dir_mapping или None, если папка не задана
+                 (например, обнулена после needs_export()).
+        """
+        return self.output_dir_mapping or None
+
+    def expected_ifc_dir_nomap(self) -> Optional[Path]:
+        """Папка, в которой ожидается IFC без маппинга.
+
+        Учитывает глобальный флаг FLAG_UNMAPPED: если он выключен,
+        папка считается неактуальной и возвращается None.
+
+        :return: output_dir_nomap или None.
+        """
+        if FLAG_UNMAPPED and self.output_dir_nomap:
+            return self.output_dir_nomap
+        return None
+
     def expected_ifc_path_mapping(self) -> Optional[Path]:
         """Ожидаемый путь к IFC в папке «mapped».
 
@@ -323,8 +428,9 @@ class RevitModel:
                  если output_dir_mapping не задан (например, обнулён после
                  needs_export()).
         """
-        if self.output_dir_mapping:
-            return self.output_dir_mapping / f"{self.name}.ifc"
+        folder = self.expected_ifc_dir_mapping()
+        if folder is not None:
+            return folder / f"{self.name}.ifc"
         return None
 
     def expected_ifc_path_nomap(self) -> Optional[Path]:
@@ -335,6 +441,70 @@ class RevitModel:
 
         :return: Путь к <output_dir_nomap>/<name>.ifc или None.
         """
-        if FLAG_UNMAPPED and self.output_dir_nomap:
-            return self.output_dir_nomap / f"{self.name}.ifc"
+        folder = self.expected_ifc_dir_nomap()
+        if folder is not None:
+            return folder / f"{self.name}.ifc"
         return None
+
+
+# ---------------------- пакетная проверка моделей ----------------------
+def batch_needs_export(
+    models: Sequence[RevitModel],
+    history: HistoryLike,
+    ifc_checker: IFCCheckerLike,
+    workers: int = EXPORT_CHECK_WORKERS,
+) -> List[RevitModel]:
+    """Параллельно проверяет модели и возвращает те, что требуют экспорта.
+
+    Поведение:
+        - decide_export() выполняется в пуле потоков (проверки IFC
+          упираются в stat()/scandir, которые отпускают GIL);
+        - apply_decision() применяется последовательно, в исходном
+          порядке моделей.
+
+    :param models: Модели для проверки.
+    :param history: Объект, реализующий HistoryLike.
+    :param ifc_checker: Объект, реализующий IFCCheckerLike (должен быть
+                        потокобезопасным).
+    :param workers: Максимальное число потоков.
+    :return: Модели, для которых нужен экспорт (порядок сохраняется).
+    """
+    if not models:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(models))) as pool:
+        decisions = list(
+            pool.map(lambda m: m.decide_export(history, ifc_checker), models)
+        )
+
+    return [
+        model
+        for model, decision in zip(models, decisions)
+        if model.apply_decision(decision)
+    ]
+
+
+def batch_load_versions(
+    models: Sequence[RevitModel],
+    cache: Optional[VersionCacheLike] = None,
+    workers: int = EXPORT_CHECK_WORKERS,
+) -> None:
+    """Параллельно определяет версии Revit для списка моделей.
+
+    Поведение:
+        - load_version(cache=cache) выполняется в пуле потоков: чтение
+          заголовков RVT упирается в диск/сеть, а не в CPU (GIL
+          отпускается на время ввода-вывода);
+        - каждая модель заполняет только свои поля version/build.
+
+    :param models: Модели, для которых нужна версия.
+    :param cache: Кэш версий между запусками (должен быть
+                  потокобезопасным) или None.
+    :param workers: Максимальное число потоков.
+    """
+    if not models:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(models))) as pool:
+        # list() — дожидаемся всех и пробрасываем исключения потоков.
+        list(pool.map(lambda m: m.load_version(cache=cache), models))
@@ -11,24 +11,39 @@
       через utils.cli.safe_path.
     - В дочерний процесс передаётся EXPORTIFC_ROOT=DIR_SCRIPTS, чтобы
       Settings мог корректно определить корень проекта.
+    - Вместе с ним передаётся ENV_REVIT_VERSION=<ver>: по нему
+      ExportIFC.py выбирает свой <TMP_NAME><ver>.csv.
     - Возвращает код возврата процесса: 0 — успех; иное — ошибка.
+    - run_all() запускает несколько версий (по очереди или до
+      max_workers одновременно) и возвращает коды по версиям.
 
 Особенности:
     - Используются «безопасные» пути (8.3/короткие) для скрипта и
       аргумента --models (минимизация проблем с пробелами/кириллицей).
     - Модуль не мутирует os.environ: формирует отдельный словарь env_add
       и передаёт его в run_cmd_streaming().
+    - Базовый env_add вычисляется один раз за процесс (корень скриптов и
+      исходное окружение не меняются); к нему добавляются только версия
+      и момент запуска оркестратора.
+    - Одновременные запуски безопасны: каждая версия — отдельный процесс
+      pyRevit со своим Revit, Task- и CSV-файлом.
 """
 import os
 import logging
 from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
 from dataclasses import dataclass
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple
 
 from config import (
     LOGGER_NAME,
     DIR_SCRIPTS,
     SCRIPT_EXPORT_IFC
 )
+from config.constants import ENV_REVIT_VERSION, ENV_RUN_DATE
 
 from utils.cli import run_cmd_streaming, safe_path
 
@@ -44,12 +59,16 @@ class PyRevitRunner:
         script: Путь к скрипту ExportIFC.py, который будет запускаться
                 через pyrevit run.
         debug:  Флаг отладочного режима (добавляет аргумент --debug).
+        run_date: Момент запуска оркестратора; передаётся в pyRevit через
+                  ENV_RUN_DATE для датировки txt-логов (None — не передаётся).
     """
 
     # Путь к исполняемому скрипту pyRevit (ExportIFC.py)
     script: Path = SCRIPT_EXPORT_IFC
     # Флаг отладочного запуска (добавляет --debug к команде)
     debug: bool = False
+    # Момент запуска оркестратора (дата в именах txt-логов pyRevit)
+    run_date: Optional[datetime] = None
 
     def __post_init__(self) -> None:
         """Нормализует путь к скрипту (safe_path + Path).
@@ -72,7 +91,62 @@ class PyRevitRunner:
         :param task_file: Путь к Task<version>.txt (список моделей).
         :return:          Код возврата процесса (0 — успех).
         """
+        return self._run(version, task_file, on_line=log.info)
+
+    def run_all(
+        self,
+        per_version: Sequence[Tuple[int, Path]],
+        max_workers: int = 1,
+    ) -> Dict[int, int]:
+        """Вызывает pyRevit CLI для нескольких версий Revit.
+
+        Поведение:
+            - max_workers <= 1 (или одна версия) — версии запускаются
+              по очереди, как в run_for_version();
+            - иначе — до max_workers процессов pyRevit одновременно
+              (у каждой версии свой Revit, Task- и CSV-файл); строки
+              вывода помечаются префиксом [версия].
+
+        :param per_version: Пары (версия, путь к Task<version>.txt).
+        :param max_workers: Максимум одновременных процессов pyRevit.
+        :return:            Коды возврата по версиям {версия: код}.
+        """
+        if max_workers <= 1 or len(per_version) <= 1:
+            return {
+                ver: self.run_for_version(ver, task_file)
+                for ver, task_file in per_version
+            }
+
+        def _run_prefixed(item: Tuple[int, Path]) -> int:
+            """Запускает версию с пометкой строк вывода [версия]."""
+            ver, task_file = item
+            return self._run(
+                ver,
+                task_file,
+                on_line=lambda line: log.info("[%s] %s", ver, line),
+            )
+
+        workers = min(max_workers, len(per_version))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            codes = pool.map(_run_prefixed, per_version)
+            return {
+                ver: rc for (ver, _), rc in zip(per_version, codes)
+            }
 
+    # -------------------- внутренние методы --------------------
+    def _run(
+        self,
+        version: int,
+        task_file: Path,
+        on_line: Callable[[str], None],
+    ) -> int:
+        """Собирает команду pyRevit CLI и выполняет её (блокирующе).
+
+        :param version:   Год/версия Revit.
+        :param task_file: Путь к Task<version>.txt.
+        :param on_line:   Обработчик строк вывода pyRevit.
+        :return:          Код возврата процесса (0 — успех).
+        """
         cmd = [
             "pyrevit",
             "run",
@@ -86,52 +160,81 @@ class PyRevitRunner:
             cmd.append("--debug")
 
         # Важно:
-        #   - on_line=log.info  -> каждая строка stdout pyRevit попадает в лог;
+        #   - on_line           -> каждая строка stdout pyRevit попадает в лог;
         #   - env_add           -> отдельный словарь окружения, не портим
         #                          глобальный os.environ.
         return run_cmd_streaming(
             cmd,
-            on_line=log.info,
-            env_add=self._build_env(),
+            on_line=on_line,
+            env_add=self._build_env(version, self.run_date),
         )
 
-    # -------------------- внутренние методы --------------------
     @staticmethod
-    def _build_env() -> dict[str, str]:
-        """Формирует доп. окружение для процесса pyRevit.
+    def _build_env(
+        version: int,
+        run_date: Optional[datetime] = None,
+    ) -> Mapping[str, str]:
+        """Возвращает доп. окружение для процесса pyRevit.
+
+        Корень с папками config/core/utils/revit/scripts. Именно его
+        Settings использует как main_dir/EXPORTIFC_ROOT. Версия Revit
+        передаётся в ENV_REVIT_VERSION, чтобы скрипт прочитал свой
+        <TMP_NAME><ver>.csv. Момент запуска (если задан) передаётся в
+        ENV_RUN_DATE как timestamp — по нему скрипт датирует txt-логи.
+
+        :param version:  Год/версия Revit.
+        :param run_date: Момент запуска оркестратора или None.
+        :return: Словарь env_add для run_cmd_streaming().
+        """
+        env = {
+            **_build_env_cached(str(DIR_SCRIPTS)),
+            ENV_REVIT_VERSION: str(version),
+        }
+        if run_date is not None:
+            env[ENV_RUN_DATE] = repr(run_date.timestamp())
+        return env
+
+
+# -------------------- окружение дочернего процесса --------------------
+@lru_cache(maxsize=1)
+def _build_env_cached(root: str) -> Mapping[str, str]:
+    """Формирует доп. окружение для процесса pyRevit (один раз за процесс).
 
-        Добавляет корень скриптов проекта в PYTHONPATH/IRONPYTHONPATH и
-        устанавливает EXPORTIFC_ROOT, чтобы Settings мог найти config/utils.
+    Добавляет корень скриптов проекта в PYTHONPATH/IRONPYTHONPATH и
+    устанавливает EXPORTIFC_ROOT, чтобы Settings мог найти config/utils.
 
-        :return: Словарь env_add для передачи в run_cmd_streaming().
+    :param root: Корень скриптов проекта (DIR_SCRIPTS).
+    :return: Неизменяемый словарь env_add (MappingProxyType).
+    """
+
+    # Исходные значения PATH-подобных переменных читаем из os.environ
+    # один раз (снимок), дальше работаем с обычным словарём.
+    env = os.environ
+    parts = {v: env.get(v, "") for v in ("PYTHONPATH", "IRONPYTHONPATH")}
+
+    def _merge(var: str) -> str:
+        """Возвращает PATH-подобную переменную с добавленным
+           префиксом root.
+
+        :param var: Имя переменной окружения (например, "PYTHONPATH"
+                    или "IRONPYTHONPATH"), значение которой нужно
+                    дополнить.
+        :return: Новое значение переменной окружения с добавленным
+                в начало путём root. Если переменная была пуста,
+                возвращается только root.
         """
-        # Корень с папками config/core/utils/revit/scripts.
-        # Именно его Settings использует как main_dir/EXPORTIFC_ROOT.
-        root = str(DIR_SCRIPTS)
-
-        def _merge(var: str) -> str:
-            """Возвращает PATH-подобную переменную с добавленным
-               префиксом root.
-
-            :param var: Имя переменной окружения (например, "PYTHONPATH"
-                        или "IRONPYTHONPATH"), значение которой нужно
-                        дополнить.
-            :return: Новое значение переменной окружения с добавленным
-                    в начало путём root. Если переменная была пуста,
-                    возвращается только root.
-            """
-            prev = os.environ.get(var, "")
-            return root if not prev else f"{root}{os.pathsep}{prev}"
-
-        return {
-            # Для Settings._detect_project_root() и всего,
-            # что ищет EXPORTIFC_ROOT.
-            "EXPORTIFC_ROOT": root,
-            # Для обычного Python-импорта модулей проекта.
-            "PYTHONPATH": _merge("PYTHONPATH"),
-            # Для ironPython внутри pyRevit (видит тот же код проекта).
-            "IRONPYTHONPATH": _merge("IRONPYTHONPATH"),
-        }
+        prev = parts[var]
+        return root if not prev else f"{root}{os.pathsep}{prev}"
+
+    return MappingProxyType({
+        # Для Settings._detect_project_root() и всего,
+        # что ищет EXPORTIFC_ROOT.
+        "EXPORTIFC_ROOT": root,
+        # Для обычного Python-импорта модулей проекта.
+        "PYTHONPATH": _merge("PYTHONPATH"),
+        # Для ironPython внутри pyRevit (видит тот же код проекта).
+        "IRONPYTHONPATH": _merge("IRONPYTHONPATH"),
+    })
 
 
 # можно добавить «щадящую» проверку перед вызовами:
@@ -19,19 +19,26 @@
     - Порядок версий и моделей детерминирован:
         * версии обрабатываются по возрастанию;
         * модели внутри версии сортируются по str(rvt_path).
+    - Корзины сортируются один раз перед первой записью файлов
+      (_finalize); Task-файлы и CSV используют уже готовый порядок.
 
 Правила распределения версий:
     - version is None → запись кейса в лог «версия не найдена».
-    - version < _min_supported → используется _min_supported.
-    - _min_supported ≤ version ≤ _max_supported → используется
-      указанная версия.
-    - version > _max_supported → запись кейса в лог
+    - version есть в _supported_versions → используется указанная версия.
+    - иначе используется ближайшая поддерживаемая версия не ниже указанной
+      (ниже минимума → минимум; «дыра» в списке → следующая версия);
+      поиск — bisect по отсортированному кортежу.
+    - version > последней поддерживаемой → запись кейса в лог
       «версия выше поддерживаемых».
 """
+import io
+from bisect import bisect_left
 from csv import writer
+from codecs import BOM_UTF8
 from pathlib import Path
+from operator import attrgetter
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from config import (
     REVIT_VERSIONS,
@@ -46,6 +53,26 @@ from utils.log_buckets import TasksLogBucket as LogBucket
 # Удобный псевдоним для пар (модель, версия).
 ModelVersionPair = tuple[RevitModel, Optional[int]]
 
+# Ключ сортировки моделей внутри версии: RevitModel.rvt_str — str(rvt_path)
+# из кэша модели (вычисляется при первом обращении).
+_BY_RVT_PATH = attrgetter("rvt_str")
+
+
+def _row(model: RevitModel) -> List[str]:
+    """Формирует строку <TMP_NAME>.csv для одной модели.
+
+    :param model: Экземпляр RevitModel.
+    :return: Список из 6 строковых полей в порядке формата CSV.
+    """
+    return [
+        model.rvt_str,
+        str(model.output_dir_mapping or ""),
+        str(model.mapping_json),
+        str(model.family_mapping_file),
+        str(model.output_dir_nomap or ""),
+        str(model.nomap_json or ""),
+    ]
+
 
 @dataclass(slots=True)
 class ExportTaskManager:
@@ -54,10 +81,12 @@ class ExportTaskManager:
     Состояние:
         tasks:              Корзины моделей по версиям Revit.
         logs:               Агрегатор проблемных кейсов (TasksLogBucket).
-        _min_supported:     Минимальная поддерживаемая версия Revit.
-        _max_supported:     Максимальная поддерживаемая версия Revit.
         _supported_versions: Канонический отсортированный список
                             поддерживаемых версий (из config.REVIT_VERSIONS).
+        _frozen:            Отсортированные корзины версий в порядке
+                            возрастания (кортежи); None — ещё не
+                            сформированы или устарели после добавления
+                            модели.
     """
 
     # Корзины моделей по версиям Revit.
@@ -66,16 +95,17 @@ class ExportTaskManager:
     # Агрегатор сообщений о проблемных моделях.
     logs: LogBucket = field(default_factory=LogBucket)
 
-    _min_supported: int = field(init=False)
-    _max_supported: int = field(init=False)
-
     # Неизменяемая фиксация канонического списка версий
     # (защита от случайной мутации).
     _supported_versions: tuple[int, ...] = tuple(REVIT_VERSIONS)
 
+    _frozen: Optional[Dict[int, Tuple[RevitModel, ...]]] = field(
+        default=None, init=False, repr=False
+    )
+
     # -------------------------- жизненный цикл --------------------------
     def __post_init__(self) -> None:
-        """Инициализирует границы поддерживаемого диапазона версий.
+        """Проверяет, что список поддерживаемых версий не пуст.
 
         :raises ValueError: Если список _supported_versions пуст.
         """
@@ -85,11 +115,6 @@ class ExportTaskManager:
                 "или отсутствовать"
             )
 
-        # Границы диапазона берём из канонического, уже отсортированного
-        # списка _supported_versions.
-        self._min_supported = self._supported_versions[0]
-        self._max_supported = self._supported_versions[-1]
-
     # ----------------------- изменение состояния -----------------------
     def add_model(self, model: RevitModel, version: Optional[int]) -> None:
         """Добавляет модель в соответствующую корзину по версии.
@@ -98,38 +123,77 @@ class ExportTaskManager:
         :param version: Версия Revit модели или None, если её не удалось
                         определить.
         """
-        # Не определили версию — отправляем в соответствующий лог.
-        if version is None:
-            self.logs.version_not_found.append(
-                f"{model.rvt_path} — у модели не найдена версия Revit"
-            )
-            return
-
-        # Версия выше поддерживаемого диапазона — фиксируем в лог.
-        if version > self._max_supported:
-            self.logs.version_too_new.append(
-                f"{model.rvt_path} — версия Revit {version} выше "
-                f"поддерживаемых ({self._min_supported}…{self._max_supported})"
-            )
-            return
-
-        # Версия ниже минимума — используем минимум диапазона.
-        if version < self._min_supported:
-            version = self._min_supported
-
-        # Помещаем модель в корзину своей версии.
-        bucket = self.tasks.setdefault(version, [])
-        bucket.append(model)
+        self.add_models(((model, version),))
 
     def add_models(self, items: Iterable[ModelVersionPair]) -> None:
         """Массово добавляет модели по парам (model, version_or_none).
 
+        Особенности:
+            - Атрибуты экземпляра (корзины, логи, список версий) читаются
+              один раз до цикла — в цикле только локальные имена.
+
         :param items: Итератор пар (RevitModel, Optional[int]).
         """
+        supported = self._supported_versions
+        n_supported = len(supported)
+        tasks = self.tasks
+        not_found = self.logs.version_not_found
+        too_new = self.logs.version_too_new
+
+        # Состав корзин меняется — зафиксированный порядок устаревает.
+        self._frozen = None
+
         # Простой проход без накопления в памяти: сразу раскладываем
-        # по корзинам через add_model().
+        # по корзинам.
         for model, version in items:
-            self.add_model(model, version)
+            # Не определили версию — отправляем в соответствующий лог.
+            if version is None:
+                not_found.append(
+                    f"{model.rvt_path} — у модели не найдена версия Revit"
+                )
+                continue
+
+            # Ближайшая поддерживаемая версия не ниже указанной.
+            idx = bisect_left(supported, version)
+
+            # Версия выше поддерживаемого диапазона — фиксируем в лог.
+            if idx == n_supported:
+                too_new.append(
+                    f"{model.rvt_path} — версия Revit {version} выше "
+                    f"поддерживаемых ({supported[0]}…{supported[-1]})"
+                )
+                continue
+
+            # Ниже минимума или между поддерживаемыми — открываем
+            # в следующей поддерживаемой версии.
+            version = supported[idx]
+
+            # Помещаем модель в корзину своей версии.
+            bucket = tasks.get(version)
+            if bucket is None:
+                bucket = tasks[version] = []
+            bucket.append(model)
+
+    def _finalize(self) -> Dict[int, Tuple[RevitModel, ...]]:
+        """Однократно сортирует модели внутри каждой корзины по str(rvt_path)
+        и фиксирует результат в _frozen.
+
+        Повторный вызов без добавления новых моделей ничего не сортирует
+        и возвращает уже готовый результат.
+
+        :return: {версия: кортеж моделей}, версии по возрастанию.
+        """
+        if self._frozen is not None:
+            return self._frozen
+
+        frozen: Dict[int, Tuple[RevitModel, ...]] = {}
+        for version in sorted(self.tasks):
+            bucket = self.tasks[version]
+            bucket.sort(key=_BY_RVT_PATH)
+            frozen[version] = tuple(bucket)
+
+        self._frozen = frozen
+        return frozen
 
     # ------------------------ файловый вывод ---------------------------
     def write_task_files(self) -> None:
@@ -140,14 +204,9 @@ class ExportTaskManager:
             - внутри версии пути моделей сортируются по str(m.rvt_path);
             - по одной модели на строку.
         """
-        # Обрабатываем версии по возрастанию для стабильного, предсказуемого
-        # результата.
-        for version in sorted(self.tasks.keys()):
-            # Внутри версии сортируем пути моделей по строковому представлению.
-            models = sorted(
-                self.tasks[version],
-                key=lambda m: str(m.rvt_path),
-            )
+        # Модели внутри корзин сортируются один раз; версии в _frozen уже
+        # идут по возрастанию (стабильный, предсказуемый результат).
+        for version, models in self._finalize().items():
 
             # Путь к файлу задачи определяется фасадом config.
             task_path = build_task_path(version)
@@ -159,20 +218,20 @@ class ExportTaskManager:
 
             # Одна строка = один путь к модели.
             task_path.write_text(
-                "\n".join(str(m.rvt_path) for m in models),
+                "\n".join(m.rvt_str for m in models),
                 encoding="utf-8",
             )
 
     def write_tmp_csv(self, base_dir: Path, version: int) -> Path:
-        """Создаёт временный CSV (<TMP_NAME>.csv) для указанной версии Revit.
+        """Создаёт временный CSV (<TMP_NAME><ver>.csv) для версии Revit.
 
         Формат строк (разделитель `;`):
             path;output_dir_mapping;mapping_json;family_mapping_file;
             output_dir_nomap;nomap_json
 
-        :param base_dir: Папка, в которой создаётся <TMP_NAME>.csv.
+        :param base_dir: Папка, в которой создаётся <TMP_NAME><ver>.csv.
         :param version:  Версия Revit, для которой формируется CSV.
-        :return:         Полный путь к созданному файлу <TMP_NAME>.csv.
+        :return:         Полный путь к созданному файлу <TMP_NAME><ver>.csv.
         """
 
         # (пока не используется)
@@ -180,31 +239,22 @@ class ExportTaskManager:
         # то можно динамически создавать директорию
         # base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Путь к CSV формируется через config.build_csv_path.
-        tmp_path = build_csv_path(base_dir=base_dir)
-
-        # Собираем строки только для указанной версии; порядок — по
-        # строковому пути к модели.
-        rows: List[List[str]] = []
-        for model in sorted(
-            self.tasks.get(version, []),
-            key=lambda m: str(m.rvt_path),
-        ):
-            rows.append(
-                [
-                    str(model.rvt_path),
-                    str(model.output_dir_mapping or ""),
-                    str(model.mapping_json),
-                    str(model.family_mapping_file),
-                    str(model.output_dir_nomap or ""),
-                    str(model.nomap_json or ""),
-                ]
-            )
+        # Путь к CSV формируется через config.build_csv_path: у каждой
+        # версии свой файл, поэтому pyRevit может обрабатывать версии
+        # одновременно.
+        tmp_path = build_csv_path(base_dir=base_dir, version=version)
+
+        # Строки только для указанной версии; порядок — по строковому
+        # пути к модели (корзины зафиксированы в _finalize).
+        models = self._finalize().get(version, ())
 
         # Пишем CSV без заголовков — ревитовский скрипт ожидает
-        # «чистые» данные.
-        with tmp_path.open("w", encoding="utf-8-sig", newline="") as f:
-            csv_writer = writer(f, delimiter=";")
-            csv_writer.writerows(rows)
+        # «чистые» данные. Строки форматируются в памяти (StringIO),
+        # файл записывается одним вызовом. Кодировка — UTF-8 с BOM
+        # (читается как utf-8-sig): BOM добавляется байтами к уже
+        # закодированному содержимому.
+        buf = io.StringIO(newline="")
+        writer(buf, delimiter=";").writerows(map(_row, models))
+        tmp_path.write_bytes(BOM_UTF8 + buf.getvalue().encode("utf-8"))
 
         return tmp_path
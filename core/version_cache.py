@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""Кэш версий Revit для файлов *.rvt между запусками.
+
+Назначение:
+    - Не читать заголовок *.rvt повторно, если файл не менялся с прошлого
+      запуска оркестратора.
+    - Хранить результат RevitVersionInfo (год, build) на диске
+      (<VERSION_CACHE_NAME>.json в admin_data).
+
+Контракты:
+    - Запись кэша действительна, пока у файла совпадают st_mtime_ns
+      и st_size; иначе версия определяется заново через RevitVersionInfo.
+    - Кэшируется только распознанная версия: None может означать и
+      временный сбой чтения (файл занят, обрыв сети), поэтому такие модели
+      перечитываются при каждом запуске. Старые null-записи при загрузке
+      отбрасываются.
+    - Отсутствующий или повреждённый файл кэша трактуется как «кэш пустой».
+    - Файл кэша сохраняется атомарно (временный файл + os.replace):
+      сбой при записи не уничтожает предыдущий кэш.
+    - При сохранении в файл попадают только записи моделей, версия которых
+      запрашивалась в текущем запуске (кэш не разрастается).
+
+Особенности:
+    - Ошибки чтения/записи кэша не прерывают экспорт: они логируются,
+      а версия определяется обычным способом.
+    - get_version() можно вызывать из нескольких потоков
+      (см. core.models.batch_load_versions): _entries только читается,
+      а в _used каждый поток пишет запись своей модели.
+"""
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from config import LOGGER_NAME, VERSION_CACHE_PATH
+
+from revit.versions import RevitVersionInfo, YearBuild
+
+# Модульный логгер (наследует конфигурацию от "export_ifc")
+log = logging.getLogger(f"{LOGGER_NAME}.version_cache")
+
+# Запись кэша: (st_mtime_ns, st_size, год или None, build или None)
+CacheEntry = Tuple[int, int, Optional[int], Optional[str]]
+
+
+class VersionCache:
+    """Кэш (путь, mtime, size) → (год, build) для моделей Revit.
+
+    Состояние:
+        - path     — путь к файлу кэша (<VERSION_CACHE_NAME>.json);
+        - _entries — записи, загруженные из файла: путь → CacheEntry;
+        - _used    — записи, актуальные для текущего запуска.
+
+    Методы:
+        - get_version(rvt_path) — (год, build) из кэша или из файла RVT;
+        - save()               — сохраняет актуальные записи на диск.
+    """
+
+    def __init__(self, path: Path = VERSION_CACHE_PATH) -> None:
+        """Инициализирует кэш и загружает записи из файла (если он есть).
+
+        :param path: Путь к файлу кэша.
+        """
+        self.path = path
+        self._entries: Dict[str, CacheEntry] = self._load()
+        self._used: Dict[str, CacheEntry] = {}
+
+    # ----------------------------- публичный API -----------------------------
+    def get_version(self, rvt_path: Path) -> Optional[YearBuild]:
+        """Возвращает (год, build) модели, по возможности без чтения RVT.
+
+        :param rvt_path: Путь к файлу .rvt.
+        :return: Кортеж (year, build) или None, если версию определить
+                 не удалось.
+        """
+        key = str(rvt_path)
+
+        try:
+            st = os.stat(key)
+        except OSError:
+            # Файл недоступен — кэшировать нечего, решает RevitVersionInfo.
+            return RevitVersionInfo(rvt_path).as_tuple()
+
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[0] == st.st_mtime_ns
+            and entry[1] == st.st_size
+        ):
+            self._used[key] = entry
+            return entry[2], entry[3]
+
+        # Промах: читаем заголовок RVT. Запоминаем только найденную версию:
+        # None может быть временным сбоем чтения, а не отсутствием маркера.
+        info = RevitVersionInfo(rvt_path).as_tuple()
+        if info is not None:
+            year, build = info
+            self._used[key] = (st.st_mtime_ns, st.st_size, year, build)
+        return info
+
+    def save(self) -> None:
+        """Сохраняет записи текущего запуска в файл кэша."""
+        data = {key: list(entry) for key, entry in self._used.items()}
+        # Пишем во временный файл рядом и подменяем кэш одним os.replace:
+        # сбой посреди json.dump не оставит обрезанный файл кэша.
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            log.warning(
+                "Не удалось сохранить кэш версий RVT %s: %s",
+                self.path,
+                exc,
+            )
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+
+        log.info("Кэш версий RVT сохранён (%d записей)", len(data))
+
+    # ----------------------------- внутренние -----------------------------
+    def _load(self) -> Dict[str, CacheEntry]:
+        """Читает файл кэша.
+
+        :return: Словарь путь → CacheEntry (пустой при отсутствии или
+                 повреждении файла).
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+            # null-записи (старый формат кэша) не берём: версия будет
+            # определена заново.
+            return {
+                str(key): (int(v[0]), int(v[1]), v[2], v[3])
+                for key, v in raw.items()
+                if v[2] is not None
+            }
+        except (OSError, ValueError, TypeError, IndexError,
+                AttributeError) as exc:
+            log.warning(
+                "Кэш версий RVT %s не прочитан, будет пересоздан: %s",
+                self.path,
+                exc,
+            )
+            return {}
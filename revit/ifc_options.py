@@ -11,6 +11,11 @@
     - ActivePhaseId принудительно приводится к -1.
     - Сериализация конфигурации выполняется через JavaScriptSerializer;
       вложенные словари приводятся к Dictionary.
+    - Результат load_mapping_json() кэшируется в пределах процесса
+      по (путь, st_mtime, st_size): изменённый JSON перечитывается.
+    - IFCExportConfiguration с применённым DeserializeFromJson кэшируется
+      по объекту подготовленного словаря: для каждого задания с тем же
+      конфигом выполняется только UpdateOptions().
 
 Особенности:
     - Модуль может выполняться под IronPython 3.4 (pyRevit).
@@ -18,8 +23,10 @@
       современного синтаксиса, требующего более новых версий Python
       (list[str], X | Y и т.п.) в исполняемом коде.
 """
+import os
 import re
 import json
+from typing import Dict, Tuple
 
 from ._api import (
     DB,
@@ -32,11 +39,27 @@ from ._api import (
 # Фаза экспорта: -1 означает "активная фаза не задана явно".
 ACTIVE_PHASE_ID = -1
 
+# Первое целое число (миллисекунды epoch) в ClassificationEditionDate
+_MILLIS_RE = re.compile(r"-?\d+")
+# Обрамление даты в JSON сериализатора .NET: "/Date(<millis>)/"
+_DATE_WRAP_CHARS = "/Date()"
+
 __all__ = [
     "load_mapping_json",
     "build_ifc_export_options"
 ]
 
+# Кэш подготовленных конфигов: путь → (st_mtime, st_size, Dictionary).
+# Один и тот же JSON используется для множества моделей пакета; словарь
+# только читается в DeserializeFromJson, поэтому экземпляр можно отдавать
+# повторно без копирования.
+_MAPPING_CACHE: Dict[str, Tuple[float, int, Dictionary]] = {}
+
+# Кэш готовых IFCExportConfiguration: id(словаря) → (словарь, конфигурация).
+# Словарь хранится рядом, чтобы id не мог указать на другой объект:
+# совпадение проверяется по identity (is).
+_EXPORT_CFG_CACHE: Dict[int, Tuple[Dictionary, object]] = {}
+
 
 def load_mapping_json(mapping_json: str) -> Dictionary:
     """
@@ -45,15 +68,28 @@ def load_mapping_json(mapping_json: str) -> Dictionary:
     :param mapping_json: Путь к JSON-файлу настроек IFC.
     :return: Словарь настроек (.NET Dictionary, совместимый по структуре).
     """
+    # 0. Повторный вызов для неизменённого файла — ответ из кэша
+    try:
+        st = os.stat(mapping_json)
+    except OSError:
+        st = None  # ошибку доступа сообщит open() ниже
+
+    if st is not None:
+        cached = _MAPPING_CACHE.get(mapping_json)
+        if (
+            cached is not None
+            and cached[0] == st.st_mtime
+            and cached[1] == st.st_size
+        ):
+            return cached[2]
+
     # 1. Читаем JSON-файл настроек экспорта
     with open(mapping_json, "r", encoding="utf-8") as f:
         cfg = json.load(f)
 
     # 2. Дата классификатора хранится как строка с миллисекундами unix epoch.
     raw_date = cfg["ClassificationSettings"]["ClassificationEditionDate"]
-    # Ищем первое целое число в строке
-    m = re.search(r"-?\d+", raw_date)
-    millis = int(m.group()) if m else 0
+    millis = _parse_millis(raw_date)
 
     # Превращаем миллисекунды в System.DateTime (1970-01-01 + millis)
     cfg["ClassificationSettings"]["ClassificationEditionDate"] = DateTime(
@@ -64,17 +100,54 @@ def load_mapping_json(mapping_json: str) -> Dictionary:
     cfg["ActivePhaseId"] = ACTIVE_PHASE_ID
 
     # 4. Приводим вложенные словари к .NET Dictionary
-    cfg["ClassificationSettings"] = Dictionary[str, object](  # type: ignore
-        cfg["ClassificationSettings"]
-    )
-    cfg["ProjectAddress"] = Dictionary[str, object](  # type: ignore
-        cfg["ProjectAddress"]
-    )
-    cfg = Dictionary[str, object](cfg)  # type: ignore
+    cfg["ClassificationSettings"] = _to_net_dict(cfg["ClassificationSettings"])
+    cfg["ProjectAddress"] = _to_net_dict(cfg["ProjectAddress"])
+    cfg = _to_net_dict(cfg)
+
+    if st is not None:
+        _MAPPING_CACHE[mapping_json] = (st.st_mtime, st.st_size, cfg)
 
     return cfg  # type: ignore
 
 
+def _to_net_dict(src: dict) -> Dictionary:
+    """Копирует Python-словарь в .NET Dictionary[str, object].
+
+    Словарь создаётся сразу нужной ёмкости (без перехеширования при
+    росте) и заполняется через индексатор; метод items берётся в
+    локальную переменную один раз.
+
+    :param src: Словарь из json.load().
+    :return: Экземпляр Dictionary[str, object] с теми же парами.
+    """
+    dst = Dictionary[str, object](len(src))  # type: ignore
+    items = src.items
+    for key, value in items():
+        dst[key] = value
+    return dst  # type: ignore
+
+
+def _parse_millis(raw_date: str) -> int:
+    """Извлекает миллисекунды epoch из строки ClassificationEditionDate.
+
+    Обычный вид "/Date(1699999999000)/" разбирается срезом обрамления
+    без regex (re под IronPython заметно медленнее); прочие варианты
+    (например, со смещением часового пояса "+0300") — по первому целому
+    числу в строке.
+
+    :param raw_date: Значение ClassificationEditionDate из JSON.
+    :return: Миллисекунды unix epoch (0, если число не найдено).
+    """
+    try:
+        return int(raw_date.strip(_DATE_WRAP_CHARS))
+    except ValueError:
+        pass
+
+    # Ищем первое целое число в строке
+    m = _MILLIS_RE.search(raw_date)
+    return int(m.group()) if m else 0
+
+
 def build_ifc_export_options(
     family_mapping_file: str,
     change_config: Dictionary,
@@ -88,20 +161,42 @@ def build_ifc_export_options(
     :param navis_view_id:       Идентификатор 3D-вида для экспорта.
     :return:                    Настроенный экземпляр DB.IFCExportOptions.
     """
-    IFCExportConfiguration = get_ifc_export_config_class()
-
     # Создаём объект IFCExportOptions для применения настроек при выгрузке IFC
     ifc_opts: DB.IFCExportOptions = DB.IFCExportOptions()  # type: ignore
     # Применяем файл маппинга категорий/классов
     ifc_opts.FamilyMappingFile = family_mapping_file
 
+    # Конфигурация плагина IFC для этого словаря настроек (из кэша)
+    ifc_cfg = _get_export_configuration(change_config)
+
+    # Применяем все изменения к IFCExportOptions и указываем 3D-вид экспорта
+    ifc_cfg.UpdateOptions(ifc_opts, navis_view_id)
+
+    return ifc_opts
+
+
+def _get_export_configuration(change_config: Dictionary) -> object:
+    """Возвращает IFCExportConfiguration с применённым словарём настроек.
+
+    Конфигурация создаётся (CreateDefaultConfiguration +
+    DeserializeFromJson через JavaScriptSerializer) один раз на объект
+    словаря; load_mapping_json() отдаёт один и тот же словарь для
+    неизменённого JSON, поэтому повторные задания берут готовый объект.
+
+    :param change_config: Подготовленный словарь настроек.
+    :return: Экземпляр IFCExportConfiguration.
+    """
+    cached = _EXPORT_CFG_CACHE.get(id(change_config))
+    if cached is not None and cached[0] is change_config:
+        return cached[1]
+
+    IFCExportConfiguration = get_ifc_export_config_class()
+
     # Создаём объект IFCExportConfiguration для плагина по выгрузке IFC
     ifc_cfg = (IFCExportConfiguration.
                CreateDefaultConfiguration())  # type: ignore
     # Применяем изменённый JSON (change_config) через JavaScriptSerializer
     ifc_cfg.DeserializeFromJson(change_config, JavaScriptSerializer())
 
-    # Применяем все изменения к IFCExportOptions и указываем 3D-вид экспорта
-    ifc_cfg.UpdateOptions(ifc_opts, navis_view_id)
-
-    return ifc_opts
+    _EXPORT_CFG_CACHE[id(change_config)] = (change_config, ifc_cfg)
+    return ifc_cfg
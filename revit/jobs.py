@@ -23,7 +23,9 @@
         5: nomap_json
            Путь к JSON-файлу настроек экспорта без маппинга
            (может быть пустым).
-    - Класс ExportJob нормализует все непустые пути в pathlib.Path.
+    - Пути хранятся строками (str): pathlib.Path под IronPython заметно
+      дороже, а потребителям (Revit API, open(), os.path) достаточно str.
+      Path из аргументов приводится к str.
     - Обязательные поля (колонки 0, 2, 3) не могут быть пустыми.
 
 Особенности:
@@ -33,17 +35,31 @@
       (list[str], X | Y и т.п.) в исполняемом коде.
 """
 from pathlib import Path
-from typing import Dict, Union, Optional
+from collections import namedtuple
+from typing import Dict, Union, Optional, Sequence
 
 __all__ = ["ExportJob"]
 
 PathLike = Union[Path, str]
 
+# Базовый кортеж: поля в порядке колонок CSV
+_ExportJobBase = namedtuple(
+    "_ExportJobBase",
+    (
+        "rvt_path",
+        "output_dir_mapping",
+        "mapping_json",
+        "family_mapping_file",
+        "output_dir_nomap",
+        "nomap_json",
+    ),
+)
+
 
-class ExportJob(object):
+class ExportJob(_ExportJobBase):
     """Контейнер параметров экспорта для одной RVT-модели.
 
-    Атрибуты:
+    Атрибуты (str; опциональные — str или None):
         rvt_path:
             Путь к файлу *.rvt*.
         output_dir_mapping:
@@ -57,32 +73,31 @@ class ExportJob(object):
         nomap_json:
             JSON-файл настроек экспорта без маппинга или None.
 
-    Все непустые пути нормализуются в pathlib.Path, пустые опциональные
-    значения интерпретируются как None.
+    Все непустые пути хранятся строками, пустые опциональные значения
+    интерпретируются как None.
+
+    Особенности:
+        - Неизменяемый namedtuple: экземпляр создаётся одним tuple.__new__
+          без поатрибутной записи полей; __repr__ — стандартный
+          ("ExportJob(rvt_path='...', ...)").
+        - Для строк CSV используется ExportJob.from_row(row).
 
     Подробный формат CSV и соответствие колонок описаны в модульном
     докстринге.
     """
 
-    __slots__ = (
-        "rvt_path",
-        "output_dir_mapping",
-        "mapping_json",
-        "family_mapping_file",
-        "output_dir_nomap",
-        "nomap_json",
-    )
+    __slots__ = ()
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         rvt_path: PathLike,
         output_dir_mapping: Optional[PathLike],
         mapping_json: PathLike,
         family_mapping_file: PathLike,
         output_dir_nomap: Optional[PathLike] = None,
         nomap_json: Optional[PathLike] = None,
-    ) -> None:
-        """Инициализирует контейнер параметров экспорта.
+    ) -> "ExportJob":
+        """Создаёт задание с проверкой и нормализацией полей.
 
         :param rvt_path: Путь к файлу *.rvt*.
         :param output_dir_mapping: Каталог выгрузки IFC с маппингом
@@ -93,69 +108,68 @@ class ExportJob(object):
             (None → экспорт без маппинга не выполняется).
         :param nomap_json: JSON-файл настроек экспорта без маппинга
             (может быть None).
+        :return: Экземпляр ExportJob.
+        :raises ValueError: Если обязательное поле пустое.
         """
-        # 1. Обязательные поля
-        self.rvt_path = _req_path(rvt_path, "rvt_path")
-        self.mapping_json = _req_path(mapping_json, "mapping_json")
-        self.family_mapping_file = _req_path(
+        return cls.from_row((
+            rvt_path,
+            output_dir_mapping,
+            mapping_json,
             family_mapping_file,
-            "family_mapping_file",
-        )
+            output_dir_nomap,
+            nomap_json,
+        ))
 
-        # 2. Опциональные поля
-        self.output_dir_mapping = _opt_path(output_dir_mapping)
-        self.output_dir_nomap = _opt_path(output_dir_nomap)
-        self.nomap_json = _opt_path(nomap_json)
+    @classmethod
+    def from_row(cls, row: Sequence[Optional[PathLike]]) -> "ExportJob":
+        """Создаёт задание из 6 значений в порядке колонок CSV.
 
-    def as_dict(self) -> Dict[str, object]:
-        """Возвращает поля задания в виде словаря.
+        Проверка обязательных полей (колонки 0, 2, 3) и приведение пустых
+        опциональных значений к None выполняются за один проход.
 
-        Ключи совпадают с именами атрибутов из __slots__.
-        """
-        # Порядок ключей такой же, как в __slots__
-        return {
-            name: getattr(self, name)
-            for name in self.__slots__
-        }
-
-    def __repr__(self) -> str:
-        """Возвращает компактное строковое представление ExportJob.
-
-        Используется только для отладки/логов, поэтому все пути
-        приводятся к строкам (без WindowsPath(...) и т.п.), а
-        опциональные поля отображаются как None, если не заданы.
+        :param row: Последовательность ровно из 6 значений.
+        :return: Экземпляр ExportJob.
+        :raises ValueError: Если обязательное поле пустое.
         """
-        data = self.as_dict()
+        rvt_path, out_map, mapping_json, family_map, out_nomap, nomap = row
+        return tuple.__new__(cls, (
+            # Обязательные поля
+            _req_str(rvt_path, "rvt_path"),
+            # Опциональные поля
+            _opt_str(out_map),
+            _req_str(mapping_json, "mapping_json"),
+            _req_str(family_map, "family_mapping_file"),
+            _opt_str(out_nomap),
+            _opt_str(nomap),
+        ))
 
-        parts = []
-        for name in self.__slots__:
-            value = data[name]
-            # None оставляем как есть, остальные значения приводим к str
-            value = None if value is None else str(value)
-            parts.append(f"{name}={value!r}")
+    def as_dict(self) -> Dict[str, object]:
+        """Возвращает поля задания в виде словаря.
 
-        return "ExportJob(" + ", ".join(parts) + ")"
+        Ключи совпадают с именами полей (_fields), порядок — как в CSV.
+        """
+        return dict(zip(self._fields, self))
 
 
-def _req_path(val: PathLike, field_name: str) -> Path:
-    """Преобразует обязательное значение в Path.
+def _req_str(val: PathLike, field_name: str) -> str:
+    """Проверяет обязательное значение и возвращает его строкой.
 
     :param val: Значение (str или Path).
     :param field_name: Имя поля для сообщения об ошибке.
-    :return: Path.
+    :return: Путь строкой.
     :raises ValueError: Если значение пустое.
     """
     if not val:
         raise ValueError(f"ExportJob: '{field_name}' обязателен.")
-    return val if isinstance(val, Path) else Path(val)
+    return val if isinstance(val, str) else str(val)
 
 
-def _opt_path(val: Optional[PathLike]) -> Optional[Path]:
-    """Преобразует опциональное значение в Path.
+def _opt_str(val: Optional[PathLike]) -> Optional[str]:
+    """Возвращает опциональное значение строкой.
 
     :param val: Значение (str или Path) либо пустое.
-    :return: Path или None.
+    :return: Путь строкой или None.
     """
     if not val:
         return None
-    return val if isinstance(val, Path) else Path(val)
+    return val if isinstance(val, str) else str(val)
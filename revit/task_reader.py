@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
-"""Чтение параметров экспорта из admin_data/<TMP_NAME>.csv.
+"""Чтение параметров экспорта из admin_data/<TMP_NAME><ver>.csv.
 
 Назначение:
-    - Прочитать admin_data/<TMP_NAME>.csv и вернуть список ExportJob.
+    - Прочитать admin_data/<TMP_NAME><ver>.csv (CSV своей версии Revit)
+      и построчно выдать задания ExportJob.
 
 Контракты:
     - CSV: 6 колонок без заголовка; разделитель ';'; кодировка UTF-8-SIG.
+    - Строки без кавычек делятся по ';' напрямую; строки с кавычками
+      (экранирование csv.writer) разбираются через csv.reader.
     - Колонки соответствуют полям ExportJob (см. revit.jobs.ExportJob):
         0. rvt_path
         1. output_dir_mapping
@@ -13,9 +16,12 @@
         3. family_mapping_file
         4. output_dir_nomap
         5. nomap_json
-    - Путь к файлу <TMP_NAME>.csv формируется через
-      config.files.build_csv_path(base_dir=...).
-    - При отсутствии файла <TMP_NAME>.csv возвращается пустой список.
+    - Путь к файлу формируется через
+      config.files.build_csv_path(base_dir=..., version=...); без версии
+      читается общий <TMP_NAME>.csv.
+    - При отсутствии CSV-файла итератор пуст.
+    - iter_jobs() — генератор: строки читаются по одной, файл открыт,
+      пока идёт обход, и закрывается по его окончании.
 
 Особенности:
     - Модуль может выполняться под IronPython 3.4 (pyRevit).
@@ -27,7 +33,7 @@
 """
 import csv
 from pathlib import Path
-from typing import List, Union
+from typing import Iterator, Optional, Union
 
 from config.files import build_csv_path
 
@@ -38,45 +44,46 @@ __all__ = ["iter_jobs"]
 PathLike = Union[str, Path]
 
 
-def iter_jobs(dir_admin_data: PathLike) -> List[ExportJob]:
-    """Прочитать все задания из <TMP_NAME>.csv и вернуть список ExportJob.
+def iter_jobs(
+    dir_admin_data: PathLike,
+    version: Optional[int] = None,
+) -> Iterator[ExportJob]:
+    """Построчно читает задания из CSV версии и выдаёт ExportJob.
 
     :param dir_admin_data: Путь к каталогу admin_data.
-    :return: Список ExportJob в том порядке, как строки в <TMP_NAME>.csv.
+    :param version: Версия Revit (<TMP_NAME><ver>.csv) или None
+                    (общий <TMP_NAME>.csv).
+    :return: Итератор ExportJob в том порядке, как строки в CSV.
     """
     base_dir = Path(dir_admin_data)
 
-    # Путь к <TMP_NAME>.csv формируем через фасад config.files.
-    tmp_csv = build_csv_path(base_dir=base_dir)
+    # Путь к CSV формируем через фасад config.files.
+    tmp_csv = build_csv_path(base_dir=base_dir, version=version)
 
-    jobs: List[ExportJob] = []
     if not tmp_csv.exists():
-        return jobs
+        return
 
     # Читаем CSV в UTF-8-SIG, разделитель ';', без заголовка.
     with tmp_csv.open("r", encoding="utf-8-sig", newline="") as fh:
-        reader = csv.reader(fh, delimiter=";")
-        for row in reader:
+        for line in fh:
+            line = line.rstrip("\r\n")
             # Пропускаем полностью пустые строки.
-            if not row:
+            if not line:
                 continue
 
+            # Быстрый путь: без кавычек поле не может содержать ';',
+            # и строка делится простым split (csv под IronPython — чистый
+            # Python и заметно медленнее). Строки с кавычками (csv.writer
+            # экранирует так ';' и '"' в путях) разбирает csv.reader.
+            if '"' in line:
+                row = next(csv.reader((line,), delimiter=";"), [])
+            else:
+                row = line.split(";")
+
             # Приводим строку к ровно 6 колонкам:
             #   - лишние значения обрезаются;
             #   - недостающие заполняются пустыми строками.
-            row = (list(row) + [""] * 6)[:6]
-
-            # Пустые строки в опциональных полях трактуем как отсутствие
-            # значения (None), чтобы дальше не путать "" и "нет директории".
-            jobs.append(
-                ExportJob(
-                    rvt_path=row[0],
-                    output_dir_mapping=(row[1] or None),
-                    mapping_json=row[2],
-                    family_mapping_file=row[3],
-                    output_dir_nomap=(row[4] or None),
-                    nomap_json=(row[5] or None),
-                )
-            )
-
-    return jobs
+            # Пустые строки в опциональных полях ExportJob.from_row
+            # трактует как отсутствие значения (None), чтобы дальше не
+            # путать "" и "нет директории".
+            yield ExportJob.from_row((row + [""] * 6)[:6])
@@ -13,7 +13,9 @@
     2) В ней ищутся маркеры в UTF-16 LE и UTF-16 BE.
     3) Если год не найден — выполняется fallback по строке `Autodesk Revit`,
        где год идёт ПОСЛЕ маркера.
-    4) При необходимости читается весь файл и поиск повторяется.
+    4) При необходимости поиск продолжается по всему файлу, отображённому
+       в память (mmap), без чтения файла целиком в bytes; уже просмотренная
+       «голова» повторно не сканируется (кроме небольшого перекрытия).
     5) Результат доступен через `as_tuple()` или поля `year` / `build`.
 
 Контракты:
@@ -21,16 +23,24 @@
       получаем `year=None`, `build=None`.
     - Год валидируется по диапазону 2000…2100 (защита от ложных совпадений).
     - Строки в *.rvt* закодированы в UTF-16 LE/BE; поиск ведётся по коротким
-      фрагментам после маркеров.
+      фрагментам после маркеров (шаблоны года/сборки применяются к сырым
+      байтам, без декодирования).
 
 Особенности:
     - Сначала используется быстрый путь (чтение головы), затем при
-      необходимости более медленный (читается весь файл).
+      необходимости более медленный (поиск по mmap всего файла: пиковая
+      память — несколько страниц, а не размер файла).
+    - Результат разбора кэшируется в пределах процесса по
+      (путь, st_mtime_ns, st_size): повторное создание RevitVersionInfo
+      для неизменённого файла не читает его заново.
     - Класс полностью автономен и не требует подключения Revit API.
 """
+import os
 import re
+import mmap
 from pathlib import Path
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import BinaryIO, Optional, Tuple, Union
 
 # ----------------------------- константы модуля -----------------------------
 # В *.rvt* строки ресурсов хранятся в UTF-16 (как LE, так и BE).
@@ -45,6 +55,12 @@ _BLD_BE = "Build:".encode(ENC_BE)
 _AUT_LE = "Autodesk Revit".encode(ENC_LE)
 _AUT_BE = "Autodesk Revit".encode(ENC_BE)
 
+# Пары (маркер, кодировка) для _find_marker/_extract_year_from_autodesk:
+# собираются один раз при импорте, а не на каждый вызов.
+_FMT_VARIANTS = ((_FMT_LE, ENC_LE), (_FMT_BE, ENC_BE))
+_BLD_VARIANTS = ((_BLD_LE, ENC_LE), (_BLD_BE, ENC_BE))
+_AUT_VARIANTS = ((_AUT_LE, ENC_LE), (_AUT_BE, ENC_BE))
+
 # ------------------------ Ограничения чтения/разбора -------------------------
 # Сколько БАЙТ читаем из начала файла (быстрый путь)
 _READ_HEAD_BYTES = 128 * 1024  # 128 KiB
@@ -54,19 +70,42 @@ _YEAR_TAIL_BYTES = 32
 _BUILD_TAIL_BYTES = 64
 # Для fallback по 'Autodesk Revit' смотрим ТОЛЬКО ВПЕРЁД от маркера
 _AUTODESK_SUFFIX_BYTES = 128
+# Перекрытие с «головой» при поиске по всему файлу: маркер с «хвостом»,
+# обрезанный границей головы, должен найтись целиком.
+_SCAN_OVERLAP = len(_AUT_LE) + _AUTODESK_SUFFIX_BYTES
 
 # Фильтр от ложных совпадений
 _MIN_YEAR, _MAX_YEAR = 2000, 2100
 
-# Предкомпилированные шаблоны
-_RE_YEAR = re.compile(r"\b(20\d{2})\b")
-_RE_BUILD = re.compile(r"[\d._]+")
+# Предкомпилированные шаблоны по сырым байтам UTF-16 (без decode()):
+# символ ASCII в LE — (байт, 0x00), в BE — (0x00, байт).
+# Год: "20xx", не окружённый буквами/цифрами (аналог \b(20\d{2})\b).
+_RE_YEAR_LE = re.compile(
+    rb"(?<![0-9A-Za-z_]\x00)2\x000\x00[0-9]\x00[0-9]\x00(?![0-9A-Za-z_]\x00)"
+)
+_RE_YEAR_BE = re.compile(
+    rb"(?<!\x00[0-9A-Za-z_])\x002\x000\x00[0-9]\x00[0-9](?!\x00[0-9A-Za-z_])"
+)
+# Сборка: первая серия [0-9._] до ')', '\r' или '\n' (группа 1; если
+# раньше встретился ограничитель — группа пустая).
+_RE_BUILD_LE = re.compile(rb"((?:[0-9._]\x00)+)|[)\r\n]\x00")
+_RE_BUILD_BE = re.compile(rb"((?:\x00[0-9._])+)|\x00[)\r\n]")
+
+# Кодировка → (шаблон года, шаблон сборки, позиция ASCII-байта в символе)
+_ENC_PATTERNS = {
+    ENC_LE: (_RE_YEAR_LE, _RE_BUILD_LE, 0),
+    ENC_BE: (_RE_YEAR_BE, _RE_BUILD_BE, 1),
+}
 
 __all__ = ["RevitVersionInfo"]
 
 # Кортеж (год_версии, build_строкой или None, если сборка не найдена)
 YearBuild = Tuple[int, Optional[str]]
 
+# Данные для поиска маркеров: «голова» файла (bytes) или весь файл,
+# отображённый в память (mmap поддерживает find() и срезы как bytes).
+Buffer = Union[bytes, mmap.mmap]
+
 
 class RevitVersionInfo:
     """Извлекает год версии Revit и номер сборки из бинарного *.rvt.
@@ -84,10 +123,16 @@ class RevitVersionInfo:
 
     Детали:
         - Для скорости сначала читается «голова» файла, затем при необходимости
-          весь файл.
+          поиск идёт по всему файлу через mmap.
         - Ошибки I/O не пробрасываются наружу: атрибуты остаются None.
+        - Кодировка первого найденного маркера запоминается в _enc: файл
+          записан в одной кодировке, поэтому остальные маркеры ищутся
+          только в ней (без лишнего прохода по второму варианту).
     """
 
+    # Кодировка, в которой найден первый маркер (None — ещё не известна)
+    _enc: Optional[str] = None
+
     # --------------------------- инициализация/представление -----------------
     def __init__(self, path: Path | str) -> None:
         """Инициализация и разбор файла.
@@ -97,7 +142,16 @@ class RevitVersionInfo:
         self.path = Path(path)
         self.year: Optional[int] = None
         self.build: Optional[str] = None
-        self._parse_file()
+
+        # «Отпечаток» файла для кэша; недоступный файл — остаёмся с None
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+
+        self.year, self.build = _parse_cached(
+            str(self.path), st.st_mtime_ns, st.st_size
+        )
 
     def __repr__(self) -> str:
         """Возвращает краткое текстовое представление версии.
@@ -121,24 +175,53 @@ class RevitVersionInfo:
         return self.year, self.build
 
     # --------------------------------- разбор --------------------------------
+    @classmethod
+    def _parse_path(
+        cls,
+        path: Path,
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Разбирает файл без обращения к кэшу.
+
+        :param path: Путь к .rvt-файлу.
+        :return: Пара (year, build); элементы None, если не найдены.
+        """
+        info = cls.__new__(cls)
+        info.path = path
+        info.year = None
+        info.build = None
+        info._enc = None
+        info._parse_file()
+        return info.year, info.build
+
     def _parse_file(self) -> None:
         """Основной алгоритм разбора: быстрый путь + при необходимости полный.
 
         Шаги:
             1. Попытка извлечь год/сборку из «головы» файла.
             2. Fallback по 'Autodesk Revit', если год не найден.
-            3. При необходимости — повторный разбор на полном содержимом.
+            3. При необходимости — повторный разбор на полном содержимом
+               (mmap, см. _parse_full).
         """
-        # 1) Быстрый путь — читаем фиксированный префикс
+        # Файл открывается один раз: «голова» читается из дескриптора,
+        # тот же дескриптор при необходимости отображается в память.
         try:
             with open(self.path, "rb") as f:
-                head = f.read(_READ_HEAD_BYTES)
+                self._parse_handle(f)
         except Exception:
-            # Ошибка доступа/чтения — остаёмся с None
+            # Ошибка доступа/чтения/отображения — оставляем то, что удалось
+            # найти (или None).
             return
 
+    def _parse_handle(self, f: BinaryIO) -> None:
+        """Разбор по открытому файлу (см. шаги в _parse_file).
+
+        :param f: Файл .rvt, открытый в режиме "rb".
+        """
+        # 1) Быстрый путь — читаем фиксированный префикс
+        head = f.read(_READ_HEAD_BYTES)
+
         # Пытаемся вытащить год/сборку из «головы»
-        self.year = self._extract_year(head)
+        self.year, _ = self._extract_year(head)
         self.build = self._extract_build(head)
 
         if self.year is None:
@@ -149,107 +232,140 @@ class RevitVersionInfo:
         if self.year is not None and self.build is not None:
             return
 
-        # 2) Медленный путь — читаем весь файл и повторяем
-        try:
-            with open(self.path, "rb") as f:
-                data = f.read()
-        except Exception:
+        # «Голова» короче лимита — файл уже прочитан целиком (в т.ч. пустой,
+        # для которого mmap невозможен): повторять поиск негде.
+        if len(head) < _READ_HEAD_BYTES:
             return
 
+        # 2) Медленный путь — отображаем весь файл в память и повторяем.
+        #    mmap не копирует файл в память процесса: ОС подгружает только
+        #    страницы, которые реально просматривает find(). Поиск начинается
+        #    с конца «головы» (с перекрытием) и останавливается на первом
+        #    совпадении.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            self._parse_full(data, _READ_HEAD_BYTES - _SCAN_OVERLAP)
+
+    def _parse_full(self, data: Buffer, start: int = 0) -> None:
+        """Продолжает разбор по всему содержимому файла.
+
+        :param data:  Всё содержимое файла (mmap).
+        :param start: Смещение, с которого ищутся маркеры (часть файла до
+                      него уже просмотрена в «голове»).
+        """
+        # Откуда искать Build: по умолчанию — с того же смещения
+        build_from = start
+
         # Если год всё ещё не найден — пробуем снова (Format || Autodesk Revit)
         if self.year is None:
-            self.year = (
-                self._extract_year(data)
-                or self._extract_year_from_autodesk(data)
-            )
-
-        # Build могли не найти в «голове» — повторяем на полном содержимом
+            year, fmt_idx = self._extract_year(data, start)
+            if year is not None:
+                # 'Build:' записан рядом с 'Format:' (после него): ищем от
+                # найденного маркера, а не через всю геометрию до него.
+                build_from = fmt_idx
+            else:
+                year = self._extract_year_from_autodesk(data, start)
+            self.year = year
+
+        # Build могли не найти в «голове» — ищем дальше по файлу
         if self.build is None:
-            self.build = self._extract_build(data)
+            self.build = self._extract_build(data, build_from)
+            if self.build is None and build_from > start:
+                # Нетипичная раскладка: Build раньше Format — досматриваем
+                # пропущенный участок.
+                self.build = self._extract_build(data, start, build_from)
 
     # ------------------------ извлечение по маркерам ------------------------
-    @classmethod
-    def _extract_year(cls, data: bytes) -> Optional[int]:
+    def _extract_year(
+        self,
+        data: Buffer,
+        start: int = 0,
+    ) -> Tuple[Optional[int], int]:
         """Ищет 'Format:' и берёт год (20xx) из короткого «хвоста» после
            маркера.
 
         :param data: Бинарный блок файла (голова или всё содержимое).
-        :return: Год версии или None, если маркер не найден, год не распознан
-                 или выходит за допустимый диапазон.
+        :param start: Смещение начала поиска маркера.
+        :return: (year, index), где:
+                 - year  — год версии или None, если маркер не найден, год
+                   не распознан или выходит за допустимый диапазон;
+                 - index — позиция маркера 'Format:' (-1, если не найден);
+                   используется как стартовая точка поиска 'Build:'.
         """
-        idx, enc, mlen = cls._find_marker(
-            data, ((_FMT_LE, ENC_LE), (_FMT_BE, ENC_BE))
-        )
+        idx, enc, mlen = self._find_marker(data, _FMT_VARIANTS, start)
         if idx is None or enc is None:
-            return None
+            return None, -1
 
         # длина LE/BE по байтам совпадает
-        start = idx + mlen
-        tail = data[start: start + _YEAR_TAIL_BYTES]
-        txt = tail.decode(enc, errors="ignore")
+        begin = idx + mlen
+        tail = data[begin: begin + _YEAR_TAIL_BYTES]
 
         # Ищем "20xx" — самые надёжные четыре цифры
-        m = _RE_YEAR.search(txt)
-        if not m:
-            return None
-
-        try:
-            year = int(m.group(1))
-        except ValueError:
-            return None
-
-        return year if _MIN_YEAR <= year <= _MAX_YEAR else None
-
-    @classmethod
-    def _extract_build(cls, data: bytes) -> Optional[str]:
+        year = self._match_year(tail, enc)
+        if year is None:
+            return None, idx
+
+        if _MIN_YEAR <= year <= _MAX_YEAR:
+            return year, idx
+        return None, idx
+
+    def _extract_build(
+        self,
+        data: Buffer,
+        start: int = 0,
+        end: Optional[int] = None,
+    ) -> Optional[str]:
         """Ищет 'Build:' и парсит номер сборки из «хвоста».
 
         :param data: Бинарный блок файла (голова или всё содержимое).
+        :param start: Смещение начала поиска маркера.
+        :param end: Граница поиска маркера (None — до конца данных).
         :return: Строка с номером сборки или None, если маркер/номер не найден.
         """
-        idx, enc, mlen = cls._find_marker(
-            data, ((_BLD_LE, ENC_LE), (_BLD_BE, ENC_BE))
-        )
+        idx, enc, mlen = self._find_marker(data, _BLD_VARIANTS, start, end)
         if idx is None or enc is None:
             return None
 
-        start = idx + mlen
-        tail = data[start: start + _BUILD_TAIL_BYTES]
-        txt = tail.decode(enc, errors="ignore")
+        begin = idx + mlen
+        tail = data[begin: begin + _BUILD_TAIL_BYTES]
 
-        # Чистим типичные «шумы»: нулевые байты, скобки, переводы строк.
-        txt = txt.replace("\x00", " ")
-        txt = txt.split(")")[0].split("\r")[0].split("\n")[0].strip()
-
-        m = _RE_BUILD.search(txt)
-        return m.group(0) if m else None
+        # Номер — до первой скобки/перевода строки; NUL-символы (0x0000)
+        # в серию цифр не входят.
+        _, pattern, lo = _ENC_PATTERNS[enc]
+        for m in pattern.finditer(tail):
+            if m.start() % 2:
+                # Совпадение не по границе символа UTF-16
+                continue
+            digits = m.group(1)
+            return digits[lo::2].decode("ascii") if digits else None
+        return None
 
-    @classmethod
-    def _extract_year_from_autodesk(cls, data: bytes) -> Optional[int]:
+    def _extract_year_from_autodesk(
+        self,
+        data: Buffer,
+        start: int = 0,
+    ) -> Optional[int]:
         """Fallback: ищет четырёхзначный год ПОСЛЕ 'Autodesk Revit'.
 
         :param data: Бинарный блок файла (голова или всё содержимое).
+        :param start: Смещение начала поиска маркера.
         :return: Год версии или None, если найти не удалось или год вне
                  диапазона.
         """
-        for marker, enc in ((_AUT_LE, ENC_LE), (_AUT_BE, ENC_BE)):
-            i = data.find(marker)
+        hint = self._enc
+        for marker, enc in _AUT_VARIANTS:
+            if hint is not None and enc != hint:
+                continue
+            i = data.find(marker, start)
             if i == -1:
                 continue
 
             # Ищем только ВПЕРЁД от маркера: известные файлы пишут
             # "Autodesk Revit 20xx ..."
-            start = i + len(marker)
-            end = min(len(data), start + _AUTODESK_SUFFIX_BYTES)
-            frag = data[start:end].decode(enc, errors="ignore")
+            begin = i + len(marker)
+            end = min(len(data), begin + _AUTODESK_SUFFIX_BYTES)
 
-            m = _RE_YEAR.search(frag)
-            if not m:
-                continue
-
-            try:
-                year = int(m.group(1))
-            except ValueError:
+            year = self._match_year(data[begin:end], enc)
+            if year is None:
                 continue
 
             if _MIN_YEAR <= year <= _MAX_YEAR:
@@ -258,28 +374,76 @@ class RevitVersionInfo:
         return None
 
     @staticmethod
+    def _match_year(frag: bytes, enc: str) -> Optional[int]:
+        """Ищет год "20xx" в сыром фрагменте UTF-16 без декодирования.
+
+        :param frag: Байты сразу после маркера (начало — граница символа).
+        :param enc: Кодировка фрагмента ('utf-16le' / 'utf-16be').
+        :return: Год или None, если не найден.
+        """
+        pattern, _, lo = _ENC_PATTERNS[enc]
+        for m in pattern.finditer(frag):
+            if m.start() % 2 == 0:
+                # Берём ASCII-байты цифр: b"2\x000\x002\x003\x00" → b"2023"
+                return int(m.group()[lo::2])
+        return None
+
     def _find_marker(
-        data: bytes,
+        self,
+        data: Buffer,
         variants: tuple[tuple[bytes, str], ...],
+        start: int = 0,
+        end: Optional[int] = None,
     ) -> tuple[Optional[int], Optional[str], int]:
         """
         Ищет позицию маркера (LE/BE) и возвращает (индекс, кодировка, длина).
 
+        Если кодировка файла уже известна (_enc), проверяется только
+        соответствующий вариант; первая найденная кодировка запоминается.
+
         :param data: Бинарное содержимое файла или его части.
         :param variants: Набор пар (маркер_в_байтах, имя_кодировки).
+        :param start: Смещение начала поиска.
+        :param end: Граница поиска (None — до конца данных).
         :return: (index, encoding, marker_len), где:
                  - index    — позиция маркера или None, если не найден;
                  - encoding — 'utf-16le' / 'utf-16be' или None;
                  - marker_len — длина найденного маркера в байтах
                  (0, если не найден).
         """
+        # mmap.find() не принимает end=None — подставляем длину данных
+        if end is None:
+            end = len(data)
+        hint = self._enc
         for marker, enc in variants:
-            idx = data.find(marker)
+            if hint is not None and enc != hint:
+                continue
+            idx = data.find(marker, start, end)
             if idx != -1:
+                self._enc = enc
                 return idx, enc, len(marker)
         return None, None, 0
 
 
+@lru_cache(maxsize=256)
+def _parse_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+) -> Tuple[Optional[int], Optional[str]]:
+    """Кэшированный разбор файла по (путь, st_mtime_ns, st_size).
+
+    mtime_ns и size входят только в ключ кэша: изменённый файл даёт новый
+    ключ и разбирается заново.
+
+    :param path_str: Путь к .rvt-файлу.
+    :param mtime_ns: st_mtime_ns файла.
+    :param size:     st_size файла.
+    :return: Пара (year, build).
+    """
+    return RevitVersionInfo._parse_path(Path(path_str))
+
+
 # ===== Archive =====
 # Локальный пример использования:
 # if __name__ == "__main__":
@@ -14,12 +14,15 @@
     - При отсутствии подходящих видов возвращается None.
 
 Особенности:
+    - Фильтр по имени (ElementParameterFilter) строится один раз на имя
+      и переиспользуется для всех документов процесса: объекты фильтра
+      не привязаны к документу.
     - Модуль может выполняться под IronPython 3.4 (pyRevit).
     - Допускается использование модуля typing для аннотаций типов, но без
       современного синтаксиса, требующего более новых версий Python
       (list[str], X | Y и т.п.) в исполняемом коде.
 """
-from typing import Iterable, Optional, TypeVar
+from typing import Dict, Iterable, Optional, TypeVar
 
 from config.settings import SETTINGS as STG
 
@@ -32,6 +35,9 @@ T = TypeVar("T")
 # Имя 3D-вида для экспорта из настроек ([Revit] export_view3d_name)
 VIEW3D_EXPORT_NAME: str = STG.export_view3d_name
 
+# Кэш фильтров по имени вида: имя → ElementParameterFilter (VIEW_NAME == имя)
+_NAME_FILTERS: Dict[str, DB.ElementParameterFilter] = {}
+
 
 def find_export_view3d(doc: DB.Document) -> Optional[DB.View3D]:
     """Ищет 3D-вид для экспорта по имени из settings.ini.
@@ -49,42 +55,79 @@ def find_view3d_by_name(doc: DB.Document, name: str) -> Optional[DB.View3D]:
         - Рассматриваются только элементы класса View3D.
         - Исключаются шаблонные виды (IsTemplate=True).
         - Если найдено несколько видов, возвращается первый.
-        - Сначала применяется фильтр по имени на стороне Revit API,
-          затем fallback-перебор по всем 3D-видам.
+        - Сначала применяется фильтр по имени на стороне Revit API
+          (первый вид берётся через FirstElement()), затем fallback-перебор
+          по всем 3D-видам.
 
     :param doc:  Документ Revit.
     :param name: Имя вида для точного сравнения.
     :return:     Autodesk.Revit.DB.View3D или None.
     """
-    # --- Строим параметр-фильтр по имени вида (VIEW_NAME == name) ----------
-    pvp = DB.ParameterValueProvider(
-        DB.ElementId(DB.BuiltInParameter.VIEW_NAME)
-    )
-    # True = учитывать регистр
-    rule = DB.FilterStringRule(pvp, DB.FilterStringEquals(), name, True)
-    name_filter = DB.ElementParameterFilter(rule)
+    # --- Параметр-фильтр по имени вида (VIEW_NAME == name), из кэша ---------
+    name_filter = _view_name_filter(name)
 
-    # -- Сужаем набор на стороне Revit API (класс + фильтр + исключить типы) --
-    col = (
-        FEC(doc)
-        .OfClass(DB.View3D)              # только 3D-виды # type: ignore
-        .WherePasses(name_filter)        # фильтр по имени в ядре Revit
-        .WhereElementIsNotElementType()  # исключить типовые элементы
-    )
+    # Обычный случай — единственный вид с таким именем: FirstElement()
+    # находит его внутри .NET за один переход в Python.
+    view = _named_view3d_collector(doc, name_filter).FirstElement()
+    if view is not None and not view.IsTemplate:
+        return view
 
-    # Берём первый не шаблонный вид; без промежуточных списков
-    view = _first_or_none(x for x in col if not x.IsTemplate)
     if view is not None:
-        return view
+        # Первым оказался шаблон — перебираем остальные совпадения по имени
+        # (новый коллектор: FirstElement() уже прошёл по предыдущему).
+        view = _first_or_none(
+            x for x in _named_view3d_collector(doc, name_filter)
+            if not x.IsTemplate
+        )
+        if view is not None:
+            return view
 
     # --- Fallback: на некоторых сборках строковые фильтры могут "молчать" ---
+    # Сначала сравниваем имя: совпадений единицы, поэтому IsTemplate
+    # запрашивается через .NET только у видов с нужным именем.
     col_all = FEC(doc).OfClass(  # type: ignore
         DB.View3D).WhereElementIsNotElementType()
     return _first_or_none(
-        x for x in col_all if (not x.IsTemplate and x.Name == name)
+        x for x in col_all if (x.Name == name and not x.IsTemplate)
+    )
+
+
+def _named_view3d_collector(
+    doc: DB.Document,
+    name_filter: DB.ElementParameterFilter,
+) -> DB.FilteredElementCollector:
+    """Коллектор 3D-видов, отфильтрованных по имени на стороне Revit API.
+
+    :param doc:         Документ Revit.
+    :param name_filter: Фильтр VIEW_NAME == имя (см. _view_name_filter).
+    :return:            FilteredElementCollector (класс + имя + не типы).
+    """
+    return (
+        FEC(doc)
+        .OfClass(DB.View3D)              # только 3D-виды # type: ignore
+        .WherePasses(name_filter)        # фильтр по имени в ядре Revit
+        .WhereElementIsNotElementType()  # исключить типовые элементы
     )
 
 
+def _view_name_filter(name: str) -> DB.ElementParameterFilter:
+    """Возвращает фильтр VIEW_NAME == name (строится один раз на имя).
+
+    :param name: Имя вида для точного сравнения (с учётом регистра).
+    :return:     DB.ElementParameterFilter.
+    """
+    name_filter = _NAME_FILTERS.get(name)
+    if name_filter is None:
+        pvp = DB.ParameterValueProvider(
+            DB.ElementId(DB.BuiltInParameter.VIEW_NAME)
+        )
+        # True = учитывать регистр
+        rule = DB.FilterStringRule(pvp, DB.FilterStringEquals(), name, True)
+        name_filter = DB.ElementParameterFilter(rule)
+        _NAME_FILTERS[name] = name_filter
+    return name_filter
+
+
 def _first_or_none(items: Iterable[T]) -> Optional[T]:
     """Возвращает первый элемент из итерируемого объекта или None.
 
@@ -21,12 +21,17 @@
       не импортируется в IronPython-скрипты.
 """
 import os
+import re
+import codecs
 import ctypes
+import locale
 import threading
 import subprocess
 from pathlib import Path
+from functools import lru_cache
 from ctypes import wintypes
 from typing import (
+    List,
     Mapping,
     Optional,
     Callable,
@@ -45,11 +50,29 @@ _GetShortPathNameW.argtypes = (
 )
 _GetShortPathNameW.restype = wintypes.DWORD
 
+# ------------------------- WinAPI: GetOEMCP -------------------------
+# OEM-кодовая страница консоли; прототип задаётся один раз, чтобы ctypes
+# не разбирал сигнатуру на каждом вызове.
+_GetOEMCP = _kernel32.GetOEMCP
+_GetOEMCP.argtypes = ()
+_GetOEMCP.restype = wintypes.UINT
+
 # 260 — исторический лимит для типичных WinAPI-буферов.
 _MAX_PATH = 260
 # 32767 — максимальная длина NT-пути в Unicode-версии WinAPI (включая NUL).
 _MAX_UNICODE_PATH = 32767
 
+# Буфер под короткий путь переиспользуется в пределах потока: run_all
+# может вызывать safe_path из нескольких потоков одновременно.
+_tls = threading.local()
+
+# Размер блока чтения stdout дочернего процесса (и буфера пайпа в Popen).
+_READ_CHUNK = 65536
+
+# Концы строк вывода — как в текстовом режиме Popen (universal newlines):
+# '\r\n', одиночный '\r' и '\n'.
+_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+
 
 # ---------------------- Вспомогательные: ASCII ----------------------
 def has_non_ascii(text: str) -> bool:
@@ -58,7 +81,8 @@ def has_non_ascii(text: str) -> bool:
     :param text: Входная строка.
     :return:     True, если есть символы c кодом > 127; иначе False.
     """
-    return any(ord(ch) > 127 for ch in text)
+    # str.isascii() проверяет строку целиком на стороне C.
+    return not text.isascii()
 
 
 # ----------------------- Вспомогательные: пути -----------------------
@@ -74,17 +98,29 @@ def get_short_path(path: str | Path) -> str:
     s = str(path)
 
     # Если файл/папка не существуют — WinAPI всё равно не поможет.
-    # Сразу отдаём исходный путь.
+    # Сразу отдаём исходный путь. Проверка не кэшируется: путь может
+    # появиться позже (например, Task-файл, созданный перед запуском).
     if not os.path.exists(s):
         return s
 
+    # Короткий путь стабилен, пока существует файл, — кэшируем по строке.
+    return _get_short_path_cached(s)
+
+
+@lru_cache(maxsize=512)
+def _get_short_path_cached(s: str) -> str:
+    """Вызывает GetShortPathNameW для существующего пути (с кэшем).
+
+    :param s: Путь в виде строки (ключ кэша).
+    :return:  Короткий путь 8.3 либо исходный путь.
+    """
     # GetShortPathNameW возвращает требуемый размер буфера, поэтому
     # повторяем вызов при нехватке места (длинные пути > 260 символов).
     # Ограничиваемся максимальной длиной NT-пути, чтобы не уйти в бесконечное
     # выделение гигантских буферов при некорректном ответе WinAPI.
     buf_size = _MAX_PATH
     while buf_size <= _MAX_UNICODE_PATH:
-        buffer = ctypes.create_unicode_buffer(buf_size)
+        buffer = _short_path_buffer(buf_size)
         result = _GetShortPathNameW(s, buffer, buf_size)
 
         # 0 — ошибка WinAPI (например, нет прав); отдаём исходный путь.
@@ -102,6 +138,22 @@ def get_short_path(path: str | Path) -> str:
     return s
 
 
+def _short_path_buffer(size: int) -> ctypes.Array:
+    """Возвращает буфер потока не меньше size символов.
+
+    Новый буфер выделяется только при первом вызове в потоке и когда
+    требуемый размер больше текущего (пути длиннее 260 символов).
+
+    :param size: Требуемый размер буфера в символах (с учётом NUL).
+    :return:     ctypes-массив c_wchar.
+    """
+    buffer = getattr(_tls, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = ctypes.create_unicode_buffer(size)
+        _tls.buffer = buffer
+    return buffer
+
+
 def safe_path(path: str | Path, force: bool = False) -> str:
     """Возвращает «безопасный» путь для Windows CLI.
 
@@ -138,13 +190,15 @@ def run_cmd_streaming(
         - Простая обёртка над subprocess.Popen, которая:
             * выводит команду (по желанию),
             * сливает stdout и stderr,
-            * читает вывод построчно в отдельном потоке и прокидывает его
-              в on_line или print, чтобы ожидание с таймаутом не блокировалось
-              на буферизованном stdout.
+            * читает вывод блоками в отдельном потоке, режет на строки и
+              прокидывает их в on_line или print, чтобы ожидание с таймаутом
+              не блокировалось на буферизованном stdout.
 
     Контракты:
         - shell=False;
-        - stdout и stderr объединены (сохраняем порядок);
+        - stdout и stderr объединены (сохраняем порядок): stderr=STDOUT
+          сливает их в один пайп ещё до буферизации, поэтому блочное
+          чтение (bufsize=_READ_CHUNK) порядок строк не меняет;
         - на Windows вывод декодируется по OEM-кодировке консоли
           (cp866 и т.п.), чтобы корректно отображалась кириллица.
 
@@ -164,49 +218,38 @@ def run_cmd_streaming(
                      означает ошибку).
     """
 
-    # 1. Локальный helper вывода строки (колбэк или stdout).
-    def _push(line: str):
-        """Передаёт строку в on_line или печатает в stdout.
-
-        :param line: Строка вывода процесса без завершающих символов
-                     перевода строки.
-        """
-
-        if on_line:
-            on_line(line)
-        else:
-            print(line)
+    # 1. Приёмник строк вывода (колбэк или print) выбирается один раз,
+    #    без ветвления на каждой строке. print() не сбрасывает stdout
+    #    принудительно — буферизацию оставляем потоку вывода.
+    _push: Callable[[str], None] = on_line if on_line else print
 
     # 2. Готовим список аргументов и echo-строку команды.
     cmd_list = list(cmd)
     if echo_cmd:
         _push(f"[run] {_format_command(cmd_list)}")
 
-    # 3. Собираем окружение процесса (текущее + env_add).
+    # 3. Собираем окружение процесса (текущее + env_add; None — наследуем).
     env = _prepare_env(env_add)
 
     # 4. Определяем кодировку для вывода (Windows: OEM кодировка консоли).
     encoding: Optional[str] = _detect_windows_encoding()
 
-    # 5. Запускаем процесс. stdout и stderr объединены в один поток,
-    #    текстовый режим + построчный буфер.
+    # 5. Запускаем процесс. stdout и stderr объединены в один поток;
+    #    пайп читается в байтовом режиме блоками, декодирование и разбиение
+    #    на строки выполняет поток-читатель.
     proc = subprocess.Popen(
         cmd_list,
         cwd=cwd,
         env=env,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        encoding=encoding,
-        errors="replace",
-        bufsize=1,  # построчно
-        universal_newlines=True,
+        bufsize=_READ_CHUNK,
         shell=False,
     )
 
     # Отдельный поток читает stdout, чтобы proc.wait(timeout) не зависал
     # из-за переполнения буфера вывода.
-    reader = _start_stdout_reader(proc, _push)
+    reader = _start_stdout_reader(proc, _push, encoding)
 
     try:
         # 6. Ожидаем завершения процесса, учитывая таймаут.
@@ -249,9 +292,13 @@ def run_cmd_streaming(
         reader.join(timeout=1)
 
 
+@lru_cache(maxsize=1)
 def _detect_windows_encoding() -> Optional[str]:
     """Определяет OEM-кодировку консоли Windows для корректного вывода.
 
+    Кодовая страница не меняется за время жизни процесса, поэтому
+    результат кэшируется: WinAPI вызывается один раз на процесс.
+
     :return: Строка вида "cp866"/"cp1251" и т.п. или None, если
              определение невозможно или платформа не Windows.
     """
@@ -261,72 +308,110 @@ def _detect_windows_encoding() -> Optional[str]:
 
     try:
         # OEM-кодировка консоли (cp866 и т.п.) подходит для stdout CLI-утилит.
-        codepage = ctypes.windll.kernel32.GetOEMCP()
+        codepage = _GetOEMCP()
         if codepage:
             return f"cp{codepage}"
     except Exception:
         return None
 
 
-def _prepare_env(env_add: Optional[Mapping[str, str]]) -> Mapping[str, str]:
+def _prepare_env(
+    env_add: Optional[Mapping[str, str]],
+) -> Optional[Mapping[str, str]]:
     """Возвращает окружение для дочернего процесса.
 
     :param env_add: Дополнительные переменные, которые нужно добавить к
                     текущему окружению.
-    :return:        Новый словарь окружения (копия os.environ с
-                    применёнными env_add).
+    :return:        None, если env_add пуст (Popen наследует окружение
+                    родителя без копирования); иначе новый словарь —
+                    os.environ с применёнными env_add.
     """
-    # Базовое окружение — текущее окружение процесса.
-    env = os.environ.copy()
-    if env_add:
-        # env_add дополняет (или переопределяет) переменные.
-        env.update(env_add)
-    return env
+    if not env_add:
+        return None
+    # env_add дополняет (или переопределяет) переменные текущего окружения.
+    return {**os.environ, **env_add}
 
 
 def _format_command(cmd_list: Sequence[str]) -> str:
     """Человекочитаемое представление команды для логирования.
 
     :param cmd_list: Последовательность аргументов команды.
-    :return:         Строка с экранированием пробельных аргументов
-                     кавычками для удобного вывода.
+    :return:         Строка по правилам CreateProcess (как её соберёт
+                     сам Popen): аргументы с пробелами — в кавычках,
+                     вложенные кавычки экранированы.
     """
-
-    # Добавляем кавычки только к аргументам с пробелами — читаемость в логе.
-    return " ".join(
-        f'"{c}"' if " " in c else str(c)
-        for c in cmd_list
-    )
+    return subprocess.list2cmdline(cmd_list)
 
 
 def _start_stdout_reader(
     proc: subprocess.Popen,
-    push: Callable[[str], None]
+    push: Callable[[str], None],
+    encoding: Optional[str] = None,
 ) -> threading.Thread:
     """Запускает поток, читающий stdout процесса.
 
-    :param proc: Процесс, stdout которого нужно читать.
-    :param push: Колбэк, принимающий строки вывода (без CR/LF).
-    :return:     Запущенный поток-читатель (daemon=True).
+    :param proc:     Процесс, stdout которого нужно читать (байтовый режим).
+    :param push:     Колбэк, принимающий строки вывода (без CR/LF).
+    :param encoding: Кодировка вывода; None — кодировка локали, как
+                     в текстовом режиме Popen.
+    :return:         Запущенный поток-читатель (daemon=True).
     """
+    # Инкрементальный декодер не рвёт многобайтные символы на границе блоков.
+    decoder = codecs.getincrementaldecoder(
+        encoding or locale.getpreferredencoding(False)
+    )(errors="replace")
 
     def _consume_stdout() -> None:
-        """Читает stdout процесса построчно в отдельном потоке.
+        """Читает stdout процесса блоками в отдельном потоке.
 
         Поток блокируется на чтении `.stdout`, чтобы основной поток мог
         управлять таймаутом/kill без риска зависнуть на буферизованном
-        выводе. Каждая строка передаётся в `push` после удаления
-        завершающих `\r`/`\n`.
+        выводе. read1() отдаёт то, что уже пришло в пайп (до _READ_CHUNK
+        байт), поэтому строки не задерживаются до заполнения блока.
+        Строки делятся по '\r\n', '\r' и '\n' (как universal newlines) и
+        передаются в `push` без завершающих символов; незавершённая
+        строка копится кусками и ждёт следующего блока.
 
         :return: None.
         """
 
         if proc.stdout is None:
             return
-        for raw in proc.stdout:
-            # .rstrip() убирает CR/LF, оставляя «голый» текст строки.
-            line = raw.rstrip("\r\n")
-            push(line)
+        read1 = proc.stdout.read1
+        # Куски текущей незавершённой строки: конец строки ищется только
+        # в новом блоке, без повторного разбора накопленного хвоста.
+        pieces: List[str] = []
+        # Блок закончился на '\r': '\n' в начале следующего — пара '\r\n',
+        # а не пустая строка.
+        skip_lf = False
+
+        def _feed(text: str) -> None:
+            nonlocal skip_lf
+            if not text:
+                return
+            if skip_lf and text[0] == "\n":
+                text = text[1:]
+            skip_lf = text.endswith("\r")
+
+            pos = 0
+            for m in _NEWLINE_RE.finditer(text):
+                pieces.append(text[pos:m.start()])
+                push("".join(pieces))
+                pieces.clear()
+                pos = m.end()
+            if pos < len(text):
+                pieces.append(text[pos:])
+
+        while True:
+            chunk = read1(_READ_CHUNK)
+            if not chunk:
+                break
+            _feed(decoder.decode(chunk))
+
+        # EOF: дописываем остаток декодера и последнюю строку без перевода.
+        _feed(decoder.decode(b"", final=True))
+        if pieces:
+            push("".join(pieces))
 
     reader = threading.Thread(target=_consume_stdout, daemon=True)
     reader.start()
@@ -15,7 +15,9 @@
       подстроки "$$$"; имя вида по умолчанию берётся из настроек
       (раздел [Revit], параметр export_view3d_name).
 """
+import os
 from pathlib import Path
+from functools import lru_cache
 from typing import Union
 
 from config.settings import SETTINGS as STG
@@ -45,7 +47,9 @@ def ensure_ext(name: str, default_ext: str) -> str:
     ext = default_ext if default_ext.startswith(".") else f".{default_ext}"
 
     # Уже есть нужное расширение → возвращаем как есть.
-    if n.lower().endswith(ext.lower()):
+    # В нижний регистр переводим только хвост длиной с расширение,
+    # а не всё имя.
+    if n[-len(ext):].lower() == ext.lower():
         return n
 
     # Дописываем расширение.
@@ -66,10 +70,17 @@ def is_pure_rvt(path: PathLike) -> bool:
     :param p: Путь к файлу (str или Path).
     :return:  True, если расширение одно и это '.rvt'; иначе False.
     """
-    path = path if isinstance(path, Path) else Path(path)
-    return (len(path.suffixes) == 1) and (path.suffix.lower() == ".rvt")
+    name = os.path.basename(path)
 
+    # Быстрый отсев: последнее расширение не .rvt.
+    if name[-4:].lower() != ".rvt":
+        return False
 
+    # Как Path.suffixes: ведущие точки (скрытые файлы) суффиксом не считаются.
+    return name.lstrip(".").count(".") == 1
+
+
+@lru_cache(maxsize=32)
 def format_log_name_with_view(
     template: str = LOGFILE_MISSING_VIEW_TEMPLATE,
     view_name: str = STG.export_view3d_name,
@@ -80,6 +91,10 @@ def format_log_name_with_view(
     на переданное имя вида. Если подстрока не найдена, шаблон
     возвращается как есть.
 
+    Результат кэшируется по паре (template, view_name): оба значения
+    неизменны в пределах запуска, поэтому повторные вызовы (в т.ч. со
+    значениями по умолчанию) отдают готовую строку.
+
     :param template: Шаблон базового имени лог-файла
                      (например, "2_not_view_$$$_in_models").
     :param view_name: Имя 3D-вида для экспорта IFC.
@@ -5,7 +5,8 @@
     - Создание директории по пути (если нужно).
     - Нормализация путей (resolve_if_exists).
     - Получение времени модификации файла.
-    - Нормализация времени модификации «до минут».
+    - Нормализация времени модификации «до минут» (в т.ч. готового
+      st_mtime через mtime_minute).
 
 Контракты:
     - Все функции принимают как Path, так и str (через PathLike).
@@ -19,6 +20,7 @@
     - file_mtime_minute отбрасывает секунды и микросекунды для унификации
       сравнения дат «до минут» во всём проекте.
 """
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Union, overload
@@ -79,8 +81,13 @@ def resolve_if_exists(path: Optional[PathLike]) -> Optional[Path]:
             return path_obj
         # нормализуем путь и возвращаем с расширением в нижнем регистре
         resolved = path_obj.resolve()
-        if resolved.suffix:
-            return resolved.with_suffix(resolved.suffix.lower())
+        suffix = resolved.suffix
+        # with_suffix пересобирает Path — только если регистр меняется.
+        if suffix and suffix != suffix.lower():
+            return resolved.with_suffix(suffix.lower())
+        # Без расширения (например, папка) или расширение уже в нижнем
+        # регистре — просто абсолютный путь.
+        return resolved
     except OSError:
         # В случае ошибки тоже возвращаем Path
         return path_obj
@@ -91,19 +98,19 @@ def file_mtime(path: PathLike) -> Optional[datetime]:
     """Возвращает локальное время модификации файла.
 
     Особенности:
-        - Значение берётся из path.stat().st_mtime (секунды с эпохи).
+        - Значение берётся из os.stat(path).st_mtime (секунды с эпохи);
+          os.stat принимает и str, и Path, поэтому Path не создаётся.
         - Возвращается naive datetime в локальном часовом поясе.
-        - При ошибке (нет файла, нет прав и т.п.) возвращает None.
+        - При ошибке доступа (нет файла, нет прав и т.п.) или
+          некорректном пути/времени (ValueError) возвращает None.
 
     :param path: Путь к файлу (Path или str).
     :return:     datetime (локальное время), либо None при
                  ошибке/недоступности.
     """
-    p = Path(path)
     try:
-        mtime = p.stat().st_mtime
-        return datetime.fromtimestamp(mtime)
-    except Exception:
+        return datetime.fromtimestamp(os.stat(path).st_mtime)
+    except (OSError, ValueError):
         return None
 
 
@@ -113,12 +120,33 @@ def file_mtime_minute(path: PathLike) -> Optional[datetime]:
     Используется для унификации дат при сравнении истории и целевых файлов:
     секунды/микросекунды отбрасываются, чтобы избежать «шума» при сравнении.
 
+    Особенности:
+        - Секунды отсекаются ещё на уровне timestamp, поэтому datetime
+          создаётся один раз (без промежуточного значения и replace()).
+          Часовые пояса смещены от UTC на целое число минут, так что
+          результат совпадает с fromtimestamp(...).replace(second=0,
+          microsecond=0).
+
+        - Один вызов os.stat без промежуточного Path.
+
     :param path: Путь к файлу (Path или str).
     :return:     datetime без секунд/микросекунд, либо None.
     """
-    dt = file_mtime(path)
-    if dt is None:
+    try:
+        return mtime_minute(os.stat(path).st_mtime)
+    except (OSError, ValueError):
         return None
 
-    # Отсекаем "шум" секунд и микросекунд — важно при сравнении дат и логах.
-    return dt.replace(second=0, microsecond=0)
+
+def mtime_minute(mtime: float) -> datetime:
+    """Переводит st_mtime (секунды с эпохи) в datetime, округлённый до минут.
+
+    Позволяет использовать уже полученный stat_result (например, от
+    os.DirEntry.stat()) без повторного обращения к файлу.
+
+    :param mtime: Время модификации, как в os.stat_result.st_mtime.
+    :return:      Naive datetime (локальное время) без секунд/микросекунд.
+    """
+    # Отсекаем "шум" секунд и микросекунд — важно при сравнении дат
+    # и логах.
+    return datetime.fromtimestamp(mtime - mtime % 60)
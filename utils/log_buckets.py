@@ -6,7 +6,8 @@
       и последующей записи в текстовые логи.
 
 Контракты:
-    - Запись выполняется через utils.logs.write_log_lines().
+    - Запись выполняется через utils.logs.write_log_lines() /
+      write_log_batch() (логи pyRevit-скрипта — одним пакетом).
     - Имена файлов логов согласованы с константами config.constants:
         * Оркестратор (tasks):
             - LOGFILE_VERSION_NOT_FOUND
@@ -26,6 +27,7 @@
       (list[str], X | Y и т.п.) в исполняемом коде.
 """
 from pathlib import Path
+from typing import List
 
 from config.constants import (
     LOGFILE_EXPORT_ERRORS,
@@ -34,7 +36,7 @@ from config.constants import (
     LOGFILE_VERSION_NOT_FOUND,
 )
 
-from utils.logs import write_log_lines
+from utils.logs import write_log_batch, write_log_lines
 from utils.files import format_log_name_with_view
 
 # Имя лог-файла моделей без 3D-вида для экспорта IFC
@@ -42,6 +44,20 @@ from utils.files import format_log_name_with_view
 LOGFILE_MISSING_VIEW = format_log_name_with_view()
 
 
+def _dedup_sort(lines: List[str]) -> List[str]:
+    """Убирает повторы и сортирует список строк на месте.
+
+    Одна и та же модель может попасть в корзину несколько раз (повторные
+    задания, несколько конфигов); в лог каждая строка пишется один раз.
+
+    :param lines: Список строк корзины (изменяется на месте).
+    :return:      Тот же список — уникальные строки по возрастанию.
+    """
+    lines[:] = set(lines)
+    lines.sort()
+    return lines
+
+
 class TasksLogBucket(object):
     """Корзина логов для этапа оркестрации (формирование задач/CSV).
 
@@ -71,20 +87,21 @@ class TasksLogBucket(object):
         :param log_dir: Директория, в которую будут записаны txt-логи.
         """
         if self.version_not_found:
-            # sorted(...) — детерминированный вывод: порядок в логе
-            # не зависит от порядка накопления сообщений.
+            # _dedup_sort() — детерминированный вывод без повторов: порядок
+            # в логе не зависит от порядка накопления сообщений. Работаем
+            # на месте: корзина пишется один раз в конце, копия не нужна.
             write_log_lines(
                 log_dir,
                 LOGFILE_VERSION_NOT_FOUND,
-                sorted(self.version_not_found),
+                _dedup_sort(self.version_not_found),
             )
 
         if self.version_too_new:
-            # Та же идея: сортируем для предсказуемого порядка в логе.
+            # Та же идея: без повторов и в предсказуемом порядке.
             write_log_lines(
                 log_dir,
                 LOGFILE_VERSION_TOO_NEW,
-                sorted(self.version_too_new),
+                _dedup_sort(self.version_too_new),
             )
 
 
@@ -128,29 +145,18 @@ class PyRevitExportLogBucket(object):
 
         :param log_dir: Директория, в которую будут записаны txt-логи.
         """
-        if self.opening_errors:
-            # separator="" — не отбиваем блоки по каждой версии Revit;
-            # разделитель добавляется один раз на запуск оркестратора.
-            # sorted(...) — детерминированный порядок строк.
-            write_log_lines(
-                log_dir,
-                LOGFILE_OPENING_ERRORS,
-                sorted(self.opening_errors),
-                separator="",
-            )
-
-        if self.missing_navisview:
-            write_log_lines(
-                log_dir,
-                LOGFILE_MISSING_VIEW,
-                sorted(self.missing_navisview),
-                separator="",  # та же схема: блоки ставит оркестратор
-            )
-
-        if self.export_errors:
-            write_log_lines(
-                log_dir,
-                LOGFILE_EXPORT_ERRORS,
-                sorted(self.export_errors),
-                separator="",  # отдельно фиксируем ошибки экспорта
+        # Все три лога пишутся одним пакетом: папка и дата — один раз.
+        # separator="" — не отбиваем блоки по каждой версии Revit;
+        # разделитель добавляется один раз на запуск оркестратора.
+        # _dedup_sort() — детерминированный порядок строк без повторов.
+        entries = [
+            (base_name, _dedup_sort(lines), "")
+            for base_name, lines in (
+                (LOGFILE_OPENING_ERRORS, self.opening_errors),
+                (LOGFILE_MISSING_VIEW, self.missing_navisview),
+                (LOGFILE_EXPORT_ERRORS, self.export_errors),
             )
+            if lines
+        ]
+        if entries:
+            write_log_batch(log_dir, entries)
@@ -13,6 +13,9 @@
           перевод строки добавляется функцией;
         * если separator непустой, то после всех строк записывается
           разделитель и перевод строки.
+    - write_log_batch():
+        * то же, что write_log_lines(), но для нескольких логов сразу:
+          директория проверяется и дата вычисляется один раз на пакет.
     - append_log_separator():
         * работает только с датированным именем файла
           "<base_name>_<YYYY.MM.DD>.txt";
@@ -20,6 +23,11 @@
           ничего не делает;
         * добавляет одну строку-разделитель в конец файла без лишних
           пустых строк.
+    - Каждый блок дописывается одним os.write() с O_APPEND, без
+      файлов-блокировок (см. _write_raw).
+    - set_run_date():
+        * фиксирует дату суффикса на весь процесс: все логи запуска
+          попадают в файлы одного дня, даже если прогон пересёк полночь.
 
 Особенности:
     - Модуль может выполняться под IronPython 3.4 (pyRevit).
@@ -27,8 +35,10 @@
       современного синтаксиса, требующего более новых версий Python
       (list[str], X | Y и т.п.) в исполняемом коде.
 """
+import os
 from pathlib import Path
-from typing import Iterable, Optional
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
 from datetime import datetime
 
 from config.constants import FORMAT_DATE_LOG
@@ -41,6 +51,18 @@ from utils.compat import ensure_dir_compat
 # достаточно поменять эту константу.
 LOG_SEPARATOR = "-" * 50
 
+# Флаги os.open по режиму записи: без буферизованного слоя io, в двоичном
+# режиме (O_BINARY на Windows — без перевода '\n' в '\r\n').
+_BASE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+_OPEN_FLAGS = {
+    "a": _BASE_FLAGS | os.O_APPEND,
+    "w": _BASE_FLAGS | os.O_TRUNC,
+}
+
+# Момент запуска, от которого берётся дата в именах логов (см. set_run_date).
+# None — дата берётся из datetime.now() на каждую запись.
+_RUN_DATE: Optional[datetime] = None
+
 
 # ---------------------- внутренние хелперы ----------------------
 def _build_log_path(
@@ -48,7 +70,7 @@ def _build_log_path(
     base_name: str,
     add_date_suffix: bool,
     date_fmt: str,
-) -> Path:
+) -> str:
     """Формирует путь к txt-логу с учётом суффикса даты.
 
     Логика имени:
@@ -59,20 +81,103 @@ def _build_log_path(
     :param base_name:       Базовое имя лога без расширения.
     :param add_date_suffix: Добавлять ли суффикс текущей даты к имени файла.
     :param date_fmt:        Формат даты для суффикса.
-    :return:                Полный Path к файлу лога.
+    :return:                Полный путь к файлу лога (str — сразу для open).
+    """
+    date_str = _log_date_str(add_date_suffix, date_fmt)
+    return _cached_log_path(str(log_dir), base_name, date_str)
+
+
+def _log_date_str(add_date_suffix: bool, date_fmt: str) -> str:
+    """Возвращает суффикс даты для имени лога.
+
+    :param add_date_suffix: Нужен ли суффикс даты.
+    :param date_fmt:        Формат даты для суффикса.
+    :return:                Дата запуска (set_run_date) или текущая дата
+                            в формате date_fmt; "" — если суффикс не нужен.
+    """
+    if not add_date_suffix:
+        return ""
+    now = _RUN_DATE if _RUN_DATE is not None else datetime.now()
+    return now.strftime(date_fmt)
+
+
+@lru_cache(maxsize=64)
+def _cached_log_path(log_dir_str: str, base_name: str, date_str: str) -> str:
+    """Собирает путь к txt-логу (кэш по папке, имени и дате).
+
+    Дата входит в ключ, поэтому после смены суток путь строится заново.
+
+    :param log_dir_str: Папка для логов (строкой — ключ кэша).
+    :param base_name:   Базовое имя лога без расширения.
+    :param date_str:    Отформатированная дата суффикса или "" (без даты).
+    :return:            Полный путь к файлу лога строкой.
     """
-    if add_date_suffix:
-        date = datetime.now().strftime(date_fmt)
-        name = f"{base_name}_{date}"
-    else:
-        name = base_name
+    name = f"{base_name}_{date_str}" if date_str else base_name
 
     # ensure_ext гарантирует расширение .txt, даже если base_name уже с ним.
     filename = ensure_ext(name, ".txt")
-    return log_dir / filename
+    # os.path.join вместо Path / filename: путь сразу уходит в open().
+    return os.path.join(log_dir_str, filename)
+
+
+def _write_raw(path: str, data: bytes, mode: str = "a") -> None:
+    """Пишет байты в файл напрямую через os.open/os.write.
+
+    Файл-блокировки нет: каждый блок лога уходит одним os.write() с
+    O_APPEND (повторный вызов — только если ОС записала блок не целиком).
+    На POSIX дописывание в конец атомарно; на Windows CRT _O_APPEND — это
+    seek в конец + запись, поэтому при одновременной записи из нескольких
+    процессов pyRevit (max_parallel_versions > 1) окно гонки сужено до
+    одного системного вызова на блок, но не исключено.
+
+    :param path: Путь к файлу.
+    :param data: Готовые байты для записи.
+    :param mode: 'a' — дописывать, 'w' — перезаписывать.
+    """
+    flags = _OPEN_FLAGS.get(mode)
+    if flags is None:
+        raise ValueError(f"Неподдерживаемый режим записи лога: {mode!r}")
+
+    fd = os.open(path, flags, 0o644)
+    try:
+        # os.write может записать меньше запрошенного — дописываем остаток.
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _format_block(lines: Iterable[str], separator: str) -> str:
+    """Собирает блок лога в одну строку.
+
+    :param lines:     Строки без завершающего '\\n'.
+    :param separator: Разделитель в конце блока ("" — без разделителя).
+    :return:          Текст блока: каждая строка и разделитель — с '\\n'.
+    """
+    parts = list(lines)
+    if separator:
+        parts.append(separator)
+    if not parts:
+        return ""
+    # join по '\n' + завершающий '\n' = '\n' после каждой строки.
+    return "\n".join(parts) + "\n"
 
 
 # ---------------------- Публичное API ----------------------
+def set_run_date(dt: Optional[datetime] = None) -> None:
+    """Фиксирует дату суффикса txt-логов на время работы процесса.
+
+    Вызывается один раз при старте (оркестратор, pyRevit-скрипт), чтобы
+    логи одного запуска не разъезжались по двум файлам после полуночи и
+    append_log_separator() попадал в тот же файл, что и write_log_lines().
+
+    :param dt: Момент запуска; None — текущее время.
+    """
+    global _RUN_DATE
+    _RUN_DATE = dt if dt is not None else datetime.now()
+
+
 def write_log_lines(
     log_dir: Path,
     base_name: str,
@@ -101,19 +206,54 @@ def write_log_lines(
     :param mode:            Режим записи: 'a' — дописывать, 'w' —
                             перезаписывать.
     """
+    write_log_batch(
+        log_dir,
+        ((base_name, lines, separator),),
+        add_date_suffix=add_date_suffix,
+        date_fmt=date_fmt,
+        encoding=encoding,
+        mode=mode,
+    )
+
+
+def write_log_batch(
+    log_dir: Path,
+    entries: Iterable[Tuple[str, Iterable[str], str]],
+    *,
+    add_date_suffix: bool = True,
+    date_fmt: str = FORMAT_DATE_LOG,
+    encoding: str = "utf-8",
+    mode: str = "a",
+) -> None:
+    """Пишет несколько логов в одной папке за один проход.
+
+    Каждый элемент entries — отдельный файл (см. write_log_lines);
+    директория проверяется, а дата суффикса вычисляется один раз на пакет.
+
+    :param log_dir:         Папка для логов (будет создана при необходимости).
+    :param entries:         Тройки (base_name, lines, separator).
+    :param add_date_suffix: Добавлять ли суффикс текущей даты к именам файлов.
+    :param date_fmt:        Формат даты для суффикса.
+    :param encoding:        Кодировка файлов.
+    :param mode:            Режим записи: 'a' — дописывать, 'w' —
+                            перезаписывать.
+    """
     # 1. Гарантируем наличие целевой директории.
     ensure_dir_compat(log_dir)
 
-    # 2. Строим путь к файлу лога (с датой или без — по флагу).
-    path = _build_log_path(log_dir, base_name, add_date_suffix, date_fmt)
+    # 2. Общие для пакета части пути: папка и дата (с датой или без — по
+    #    флагу).
+    log_dir_str = str(log_dir)
+    date_str = _log_date_str(add_date_suffix, date_fmt)
+
+    for base_name, lines, separator in entries:
+        path = _cached_log_path(log_dir_str, base_name, date_str)
 
-    # 3. Пишем строки. newline="" — чтобы не плодить лишние пустые строки:
-    #    сами добавляем '\n' в конце каждой строки.
-    with open(str(path), mode, encoding=encoding, newline="") as f:
-        for line in lines:
-            f.write(f"{line}\n")
-        if separator:
-            f.write(f"{separator}\n")
+        # 3. Собираем блок целиком, кодируем один раз и пишем одним
+        #    os.write() в двоичном режиме: без io-буферов и без перевода
+        #    '\n' в '\r\n' (как прежде с newline="").
+        payload = _format_block(lines, separator).encode(encoding)
+        _write_raw(path, payload, mode)
 
 
 def append_log_separator(
@@ -151,12 +291,11 @@ def append_log_separator(
     # по умолчанию.
     path = _build_log_path(log_dir, base_name, True, date_fmt)
 
-    if not path.exists():
+    if not os.path.exists(path):
         return
 
     # Разделитель добавляем только если лог менялся в текущем запуске.
-    if min_mtime is not None and path.stat().st_mtime < min_mtime:
+    if min_mtime is not None and os.stat(path).st_mtime < min_mtime:
         return
 
-    with open(str(path), "a", encoding=encoding, newline="") as f:
-        f.write(f"{separator}\n")
+    _write_raw(path, (separator + "\n").encode(encoding))
@@ -19,131 +19,193 @@
 Особенности:
     - Никаких зависимостей от Workbook/Sheet: все функции работают
       только с примитивными значениями (tuple, str, int, float, datetime).
-    - Класс Xlsx используется как статический namespace — создавать
-      экземпляры не требуется и не предполагается.
+    - API — модульные функции (is_blank_value, is_blank_row, cell,
+      parse_datetime); класс Xlsx оставлен как статический namespace
+      над ними для совместимости.
 """
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Iterable, Optional, Sequence
 
 from openpyxl.utils.datetime import from_excel as _excel_from_serial
 
 from config import FORMAT_DATETIME
 
+# FORMAT_DATETIME совпадает с ISO-видом "YYYY-MM-DD HH:MM": такие строки
+# можно разбирать быстрым datetime.fromisoformat вместо strptime.
+_ISO_FORMAT_DATETIME = "%Y-%m-%d %H:%M"
+_FAST_ISO = FORMAT_DATETIME == _ISO_FORMAT_DATETIME
+_ISO_LEN = len("YYYY-MM-DD HH:MM")
+
+# Эпоха Excel-сериалов Windows (как WINDOWS_EPOCH в openpyxl).
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+# С сериала 60 (фиктивное 1900-02-29) поправки openpyxl не действуют:
+# дата = эпоха + дни + доля суток, округлённая до миллисекунд.
+_EXCEL_SERIAL_PLAIN_FROM = 60
+_SECS_PER_DAY = 86400
+
+
+def _excel_serial_to_datetime(value: float) -> datetime:
+    """Переводит Excel-сериал в datetime (как openpyxl from_excel).
+
+    Обычные даты (сериал >= 60) считаются напрямую от эпохи; значения
+    меньше 60 (ошибка високосного 1900 года, «только время», отрицательные)
+    отдаются from_excel из openpyxl.
+
+    :param value: Excel-сериал (дни с 1899-12-30, дробная часть — время).
+    :return:      datetime, совпадающий с результатом from_excel.
+    """
+    if value < _EXCEL_SERIAL_PLAIN_FROM:
+        return _excel_from_serial(value)
+    day, fraction = divmod(value, 1)
+    # Тот же порядок операций и округление, что и в openpyxl.
+    diff = timedelta(milliseconds=round(fraction * _SECS_PER_DAY * 1000))
+    return _EXCEL_EPOCH + timedelta(days=day) + diff
+
 
 # --------------------- api: пустые значения/строки ---------------------
-class Xlsx:
-    """Утилиты для разбора данных Excel (статические методы).
-
-    Назначение:
-        - Сгруппировать часто используемые операции над "сырыми" значениями
-          строк Excel (values_only=True):
-            * проверка пустых строк/ячеек;
-            * безопасное извлечение значений как строк;
-            * парсинг дат.
+def is_blank_value(v: Any) -> bool:
+    """Возвращает True для пустых значений.
+
+    Пустыми считаются:
+        - None;
+        - строки, состоящие только из пробелов.
+
+    :param v: Любое значение ячейки.
+    :return:  True, если значение считается пустым:
+                - None;
+                - строка, состоящая только из пробелов.
     """
+    # isspace() не создаёт копию строки, в отличие от strip().
+    return v is None or (isinstance(v, str) and (not v or v.isspace()))
+
+
+def is_blank_row(row: Optional[Iterable[Any]]) -> bool:
+    """Проверяет, что вся строка пуста.
 
-    @staticmethod
-    def is_blank_value(v: Any) -> bool:
-        """Возвращает True для пустых значений.
-
-        Пустыми считаются:
-            - None;
-            - строки, состоящие только из пробелов.
-
-        :param v: Любое значение ячейки.
-        :return:  True, если значение считается пустым:
-                    - None;
-                    - строка, состоящая только из пробелов.
-        """
-        return v is None or (isinstance(v, str) and not v.strip())
-
-    @staticmethod
-    def is_blank_row(row: Optional[Iterable[Any]]) -> bool:
-        """Проверяет, что вся строка пуста.
-
-        :param row: Последовательность значений ячеек строки
-                    (обычно кортеж из values_only=True) или None.
-        :return:    True, если row is None ИЛИ все значения в строке
-                    считаются пустыми (см. is_blank_value).
-
-        Применяется при обходе листа: первая пустая строка по договорённости
-        означает "дальше данных нет", и цикл чтения можно прервать.
-        """
-        if row is None:
-            return True
-        return all(Xlsx.is_blank_value(v) for v in row)
-
-    # -------------------- api: извлечение ячейки --------------------
-    @staticmethod
-    def cell(row: Sequence[Any], idx: int) -> Optional[str]:
-        """Безопасно извлекает ячейку как нормализованную строку.
-
-        :param row: Кортеж/список значений строки (values_only=True).
-        :param idx: 0-based индекс ячейки.
-        :return:    Строка без пробелов по краям или None, если:
-                      - индекс вне диапазона;
-                      - значение None;
-                      - значение после приведения к строке и strip()
-                        даёт пустую строку.
-
-        Пример:
-            >>> Xlsx.cell(("  A  ", None, 10), 0)
-            'A'
-            >>> Xlsx.cell(("  A  ", None, 10), 1) is None
-            True
-        """
-        if idx < 0 or idx >= len(row):
+    :param row: Последовательность значений ячеек строки
+                (обычно кортеж из values_only=True) или None.
+    :return:    True, если row is None ИЛИ все значения в строке
+                считаются пустыми (см. is_blank_value).
+
+    Применяется при обходе листа: первая пустая строка по договорённости
+    означает "дальше данных нет", и цикл чтения можно прервать.
+    """
+    if row is None:
+        return True
+    # Предикат is_blank_value встроен в цикл: без вызова функции на ячейку.
+    for v in row:
+        if v is None:
+            continue
+        if not isinstance(v, str) or (v and not v.isspace()):
+            return False
+    return True
+
+
+# ----------------------- api: извлечение ячейки -----------------------
+def cell(row: Sequence[Any], idx: int) -> Optional[str]:
+    """Безопасно извлекает ячейку как нормализованную строку.
+
+    :param row: Кортеж/список значений строки (values_only=True).
+    :param idx: 0-based индекс ячейки.
+    :return:    Строка без пробелов по краям или None, если:
+                  - индекс вне диапазона;
+                  - значение None;
+                  - значение после приведения к строке и strip()
+                    даёт пустую строку.
+
+    Пример:
+        >>> cell(("  A  ", None, 10), 0)
+        'A'
+        >>> cell(("  A  ", None, 10), 1) is None
+        True
+    """
+    if idx < 0 or idx >= len(row):
+        return None
+    val = row[idx]
+    if val is None:
+        return None
+    # Текстовые ячейки (большинство) уже str — без лишнего вызова str().
+    s = val.strip() if type(val) is str else str(val).strip()
+    return s if s else None
+
+
+# ------------------------- api: парсинг дат -------------------------
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Преобразует значение ячейки Excel в datetime.
+
+    Поддерживаемые варианты:
+        - datetime  → возвращается как есть;
+        - str       → парсинг по FORMAT_DATETIME;
+        - int/float → Excel-сериал (дни с 1899-12-30), как from_excel
+                      в openpyxl.
+
+    :param value: Значение ячейки (str | int | float | datetime | None).
+    :return:     Объект datetime или None при неуспехе.
+
+    Особенности:
+        - Для строк строго используется FORMAT_DATETIME из config;
+          строки ровно в виде "YYYY-MM-DD HH:MM" разбираются быстрым
+          datetime.fromisoformat (результат тот же, что у strptime).
+        - Excel-сериал от 60 и выше переводится напрямую от эпохи
+          (результат тот же, что у from_excel); меньшие значения —
+          через from_excel из openpyxl. Исключения переводятся в None.
+        - Логика не бросает исключений наружу, чтобы не ронять парсер
+          из-за единичной кривой ячейки.
+    """
+    # None или пустая строка — нет даты.
+    if value is None:
+        return None
+
+    # Нативный datetime — возвращаем как есть.
+    if isinstance(value, datetime):
+        return value
+
+    # Строка строго по FORMAT_DATETIME.
+    if isinstance(value, str):
+        s = value.strip()
+        if not s:
             return None
-        val = row[idx]
-        if val is None:
+        # Быстрый путь: строка ровно в ISO-виде "YYYY-MM-DD HH:MM".
+        if (
+            _FAST_ISO
+            and len(s) == _ISO_LEN
+            and s[4] == "-"
+            and s[7] == "-"
+            and s[10] == " "
+        ):
+            try:
+                return datetime.fromisoformat(s)
+            except ValueError:
+                pass
+        # Прочие написания (например, без ведущих нулей) — strptime.
+        try:
+            return datetime.strptime(s, FORMAT_DATETIME)
+        except ValueError:
             return None
-        s = str(val).strip()
-        return s if s else None
-
-    # ------------------------- api: парсинг дат -------------------------
-    @staticmethod
-    def parse_datetime(value: Any) -> Optional[datetime]:
-        """Преобразует значение ячейки Excel в datetime.
-
-        Поддерживаемые варианты:
-            - datetime  → возвращается как есть;
-            - str       → парсинг по FORMAT_DATETIME;
-            - int/float → Excel-сериал (дни с 1899-12-30) через openpyxl.
-
-        :param value: Значение ячейки (str | int | float | datetime | None).
-        :return:     Объект datetime или None при неуспехе.
-
-        Особенности:
-            - Для строк строго используется FORMAT_DATETIME из config.
-            - Для Excel-сериала используется from_excel из openpyxl,
-              исключения переводятся в None.
-            - Логика не бросает исключений наружу, чтобы не ронять парсер
-              из-за единичной кривой ячейки.
-        """
-        # None или пустая строка — нет даты.
-        if value is None:
+
+    # Числовой Excel-сериал (int/float), исключаем bool (наследник int):
+    # точная проверка типа дешевле второго isinstance и идёт первой.
+    if type(value) is not bool and isinstance(value, (int, float)):
+        try:
+            return _excel_serial_to_datetime(float(value))
+        except Exception:
             return None
 
-        # Нативный datetime — возвращаем как есть.
-        if isinstance(value, datetime):
-            return value
+    # Иные типы (list, dict, bool и т.п.) — не поддерживаются.
+    return None
 
-        # Строка строго по FORMAT_DATETIME.
-        if isinstance(value, str):
-            s = value.strip()
-            if not s:
-                return None
-            try:
-                return datetime.strptime(s, FORMAT_DATETIME)
-            except ValueError:
-                return None
 
-        # Числовой Excel-сериал (int/float), исключаем bool (наследник int).
-        if isinstance(value, (int, float)) and not isinstance(value, bool):
-            try:
-                return _excel_from_serial(float(value))
-            except Exception:
-                return None
+# ------------------- совместимость: namespace Xlsx -------------------
+class Xlsx:
+    """Утилиты для разбора данных Excel (статический namespace).
 
-        # Иные типы (list, dict, bool и т.п.) — не поддерживаются.
-        return None
+    Оставлен для совместимости: методы — те же модульные функции
+    is_blank_value / is_blank_row / cell / parse_datetime. В горячих
+    циклах удобнее импортировать функции напрямую (без поиска атрибута
+    класса на каждый вызов).
+    """
+
+    is_blank_value = staticmethod(is_blank_value)
+    is_blank_row = staticmethod(is_blank_row)
+    cell = staticmethod(cell)
+    parse_datetime = staticmethod(parse_datetime)